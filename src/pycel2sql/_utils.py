@@ -13,7 +13,7 @@ MAX_POSTGRESQL_IDENTIFIER_LENGTH = 63
 
 FIELD_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
-RESERVED_SQL_KEYWORDS: set[str] = {
+RESERVED_SQL_KEYWORDS: frozenset[str] = frozenset({
     "all", "alter", "and", "any", "array", "as", "asc", "between",
     "by", "case", "cast", "check", "column", "constraint", "create",
     "cross", "current", "current_date", "current_time", "current_timestamp",
@@ -25,7 +25,7 @@ RESERVED_SQL_KEYWORDS: set[str] = {
     "references", "right", "select", "session_user", "set", "some",
     "table", "then", "to", "true", "union", "unique", "update", "user",
     "using", "values", "when", "where", "with",
-}
+})
 
 # RE2 -> POSIX regex conversion limits
 MAX_REGEX_LENGTH = 500
@@ -57,13 +57,19 @@ def validate_field_name(name: str) -> None:
         )
 
 
+# LIKE escaping in one pass: backslash-escape wildcards and the escape char,
+# double single quotes for the enclosing string literal.
+_LIKE_ESCAPE_TABLE = str.maketrans({
+    "\\": "\\\\",
+    "%": "\\%",
+    "_": "\\_",
+    "'": "''",
+})
+
+
 def escape_like_pattern(pattern: str) -> str:
     """Escape special characters in a SQL LIKE pattern."""
-    result = pattern.replace("\\", "\\\\")
-    result = result.replace("%", "\\%")
-    result = result.replace("_", "\\_")
-    result = result.replace("'", "''")
-    return result
+    return pattern.translate(_LIKE_ESCAPE_TABLE)
 
 
 def escape_json_field_name(field_name: str) -> str:
@@ -94,89 +100,34 @@ _REDOS_QUANTIFIED_ALTERNATION = re.compile(
     r"\([^)]*\|[^)]*\)[+*?]"
 )
 
+# Unsupported RE2 constructs, compiled once rather than on every validation
+_LOOKAROUND_RE = re.compile(r"\(\?[!=<]")
+_NAMED_CAPTURE_RE = re.compile(r"\(\?P<")
+_INLINE_FLAGS_RE = re.compile(r"\(\?[imsx]")
+
+# RE2 shorthand classes and non-capturing groups, rewritten for POSIX ERE in a
+# single left-to-right pass over the pattern.
+_POSIX_TRANSLATIONS = {
+    "\\d": "[[:digit:]]",
+    "\\D": "[^[:digit:]]",
+    "\\w": "[[:alnum:]_]",
+    "\\W": "[^[:alnum:]_]",
+    "\\s": "[[:space:]]",
+    "\\S": "[^[:space:]]",
+    "\\b": "\\y",
+    "\\B": "\\Y",
+    "(?:": "(",
+}
+_POSIX_TRANSLATION_RE = re.compile(r"\\[dDwWsSbB]|\(\?:")
+
 
 def convert_re2_to_posix(re2_pattern: str) -> tuple[str, bool]:
     """Convert an RE2 regex pattern to PostgreSQL POSIX ERE.
 
     Returns (posix_pattern, case_insensitive).
     """
-    if len(re2_pattern) > MAX_REGEX_LENGTH:
-        raise InvalidRegexPatternError(
-            "regex pattern too long",
-            f"pattern length {len(re2_pattern)} exceeds limit {MAX_REGEX_LENGTH}",
-        )
-
-    validate_no_null_bytes(re2_pattern, "regex patterns")
-
-    case_insensitive = False
-    pattern = re2_pattern
-
-    # Extract (?i) flag
-    if pattern.startswith("(?i)"):
-        case_insensitive = True
-        pattern = pattern[4:]
-
-    # Reject unsupported features
-    if re.search(r"\(\?[!=<]", pattern):
-        raise InvalidRegexPatternError(
-            "lookahead/lookbehind not supported",
-            f"pattern contains lookahead/lookbehind: {re2_pattern}",
-        )
-    if re.search(r"\(\?P<", pattern):
-        raise InvalidRegexPatternError(
-            "named captures not supported",
-            f"pattern contains named captures: {re2_pattern}",
-        )
-    # Reject inline flags other than (?i) at start
-    if re.search(r"\(\?[imsx]", pattern):
-        raise InvalidRegexPatternError(
-            "inline flags not supported",
-            f"pattern contains inline flags: {re2_pattern}",
-        )
-
-    # ReDoS detection
-    if _REDOS_NESTED_QUANTIFIER.search(pattern):
-        raise InvalidRegexPatternError(
-            "potential ReDoS: nested quantifiers detected",
-            f"pattern has nested quantifiers: {re2_pattern}",
-        )
-
-    # Check nesting depth
-    depth = 0
-    max_depth = 0
-    for ch in pattern:
-        if ch == "(":
-            depth += 1
-            max_depth = max(max_depth, depth)
-        elif ch == ")":
-            depth -= 1
-    if max_depth > MAX_REGEX_NESTING:
-        raise InvalidRegexPatternError(
-            "regex nesting too deep",
-            f"pattern nesting depth {max_depth} exceeds limit {MAX_REGEX_NESTING}",
-        )
-
-    # Count groups
-    group_count = pattern.count("(") - pattern.count("(?:")
-    if group_count > MAX_REGEX_GROUPS:
-        raise InvalidRegexPatternError(
-            "too many regex groups",
-            f"pattern has {group_count} groups, limit is {MAX_REGEX_GROUPS}",
-        )
-
-    # Convert RE2 shorthand classes to POSIX
-    pattern = pattern.replace("\\d", "[[:digit:]]")
-    pattern = pattern.replace("\\D", "[^[:digit:]]")
-    pattern = pattern.replace("\\w", "[[:alnum:]_]")
-    pattern = pattern.replace("\\W", "[^[:alnum:]_]")
-    pattern = pattern.replace("\\s", "[[:space:]]")
-    pattern = pattern.replace("\\S", "[^[:space:]]")
-    pattern = pattern.replace("\\b", "\\y")
-    pattern = pattern.replace("\\B", "\\Y")
-
-    # Convert non-capturing groups to regular groups
-    pattern = pattern.replace("(?:", "(")
-
+    pattern, case_insensitive = _validate_regex_common(re2_pattern)
+    pattern = _POSIX_TRANSLATION_RE.sub(lambda m: _POSIX_TRANSLATIONS[m.group()], pattern)
     return pattern, case_insensitive
 
 
@@ -201,17 +152,17 @@ def _validate_regex_common(re2_pattern: str) -> tuple[str, bool]:
         case_insensitive = True
         pattern = pattern[4:]
 
-    if re.search(r"\(\?[!=<]", pattern):
+    if _LOOKAROUND_RE.search(pattern):
         raise InvalidRegexPatternError(
             "lookahead/lookbehind not supported",
             f"pattern contains lookahead/lookbehind: {re2_pattern}",
         )
-    if re.search(r"\(\?P<", pattern):
+    if _NAMED_CAPTURE_RE.search(pattern):
         raise InvalidRegexPatternError(
             "named captures not supported",
             f"pattern contains named captures: {re2_pattern}",
         )
-    if re.search(r"\(\?[imsx]", pattern):
+    if _INLINE_FLAGS_RE.search(pattern):
         raise InvalidRegexPatternError(
             "inline flags not supported",
             f"pattern contains inline flags: {re2_pattern}",
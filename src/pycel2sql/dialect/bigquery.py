@@ -11,7 +11,7 @@ from pycel2sql._utils import convert_re2_to_re2_native
 from pycel2sql.dialect._base import Dialect, WriteFunc
 
 # BigQuery reserved keywords
-_BIGQUERY_RESERVED: set[str] = {
+_BIGQUERY_RESERVED: frozenset[str] = frozenset({
     "all", "alter", "and", "any", "array", "as", "asc", "assert_rows_modified",
     "at", "between", "by", "case", "cast", "collate", "contains", "create",
     "cross", "cube", "current", "default", "define", "desc", "distinct",
@@ -25,7 +25,7 @@ _BIGQUERY_RESERVED: set[str] = {
     "rollup", "rows", "select", "set", "some", "struct", "tablesample",
     "then", "to", "treat", "true", "unbounded", "union", "unnest", "using",
     "when", "where", "window", "with", "within",
-}
+})
 
 _FIELD_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
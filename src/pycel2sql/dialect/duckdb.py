@@ -11,7 +11,7 @@ from pycel2sql._utils import convert_re2_to_re2_native
 from pycel2sql.dialect._base import Dialect, WriteFunc
 
 # DuckDB reserved keywords
-_DUCKDB_RESERVED: set[str] = {
+_DUCKDB_RESERVED: frozenset[str] = frozenset({
     "all", "alter", "and", "any", "array", "as", "asc", "between",
     "by", "case", "cast", "check", "column", "constraint", "create",
     "cross", "current", "current_date", "current_time", "current_timestamp",
@@ -23,7 +23,7 @@ _DUCKDB_RESERVED: set[str] = {
     "order", "outer", "primary", "references", "right", "select", "set",
     "table", "then", "to", "true", "union", "unique", "update", "using",
     "values", "when", "where", "with",
-}
+})
 
 _FIELD_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
@@ -11,7 +11,7 @@ from pycel2sql._utils import convert_re2_to_mysql
 from pycel2sql.dialect._base import Dialect, WriteFunc
 
 # MySQL reserved keywords
-_MYSQL_RESERVED: set[str] = {
+_MYSQL_RESERVED: frozenset[str] = frozenset({
     "accessible", "add", "all", "alter", "analyze", "and", "as", "asc",
     "asensitive", "before", "between", "bigint", "binary", "blob", "both",
     "by", "call", "cascade", "case", "change", "char", "character", "check",
@@ -55,7 +55,7 @@ _MYSQL_RESERVED: set[str] = {
     "values", "varbinary", "varchar", "varcharacter", "varying", "virtual",
     "when", "where", "while", "window", "with", "write", "xor",
     "year_month", "zerofill",
-}
+})
 
 _FIELD_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
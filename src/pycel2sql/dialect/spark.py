@@ -31,7 +31,7 @@ _MAX_IDENTIFIER_LENGTH = 128
 # Apache Spark SQL reserved keywords (lowercased). Sourced from the Apache
 # Spark docs (sql-ref-ansi-compliance.html#sql-keywords) plus the standard SQL
 # set.
-_SPARK_RESERVED: set[str] = {
+_SPARK_RESERVED: frozenset[str] = frozenset({
     "all", "alter", "and", "anti", "any", "array", "as", "asc", "between",
     "both", "by", "case", "cast", "check", "cluster", "collate", "column",
     "create", "cross", "cube", "current", "current_date", "current_time",
@@ -47,7 +47,7 @@ _SPARK_RESERVED: set[str] = {
     "struct", "table", "tablesample", "then", "time", "to", "trailing",
     "true", "union", "unique", "unknown", "update", "user", "using", "values",
     "when", "where", "window", "with", "year",
-}
+})
 
 _FIELD_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
@@ -10,7 +10,7 @@ from pycel2sql._errors import InvalidFieldNameError, UnsupportedDialectFeatureEr
 from pycel2sql.dialect._base import Dialect, WriteFunc
 
 # SQLite reserved keywords
-_SQLITE_RESERVED: set[str] = {
+_SQLITE_RESERVED: frozenset[str] = frozenset({
     "abort", "action", "add", "after", "all", "alter", "always", "analyze",
     "and", "as", "asc", "attach", "autoincrement", "before", "begin",
     "between", "by", "cascade", "case", "cast", "check", "collate",
@@ -33,7 +33,7 @@ _SQLITE_RESERVED: set[str] = {
     "then", "ties", "to", "transaction", "trigger", "true", "unbounded",
     "union", "unique", "update", "using", "vacuum", "values", "view",
     "virtual", "when", "where", "window", "with", "without",
-}
+})
 
 _FIELD_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldSchema:
     """Schema for a single field/column."""
 
@@ -22,9 +22,11 @@ class FieldSchema:
 class Schema:
     """Table schema with O(1) field lookup."""
 
+    __slots__ = ("_fields", "_index")
+
     def __init__(self, fields: list[FieldSchema]) -> None:
-        self._fields = list(fields)
-        self._index: dict[str, FieldSchema] = {f.name: f for f in fields}
+        self._fields = tuple(fields)
+        self._index: dict[str, FieldSchema] = {f.name: f for f in self._fields}
 
     @property
     def fields(self) -> list[FieldSchema]:
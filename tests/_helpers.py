@@ -0,0 +1,38 @@
+"""Assertion helpers shared by test modules."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+
+def assert_sql_eq(actual: str, expected: str) -> None:
+    """Assert that generated SQL equals the expected string.
+
+    A mismatch reports the first differing offset, which is easier to read
+    than a diff of a long single-line statement.
+    """
+    if actual == expected:
+        return
+    offset = next(
+        (i for i, (a, b) in enumerate(zip(actual, expected, strict=False)) if a != b),
+        min(len(actual), len(expected)),
+    )
+    raise AssertionError(
+        f"SQL differs at offset {offset}:\n"
+        f"  actual:   {actual}\n"
+        f"  expected: {expected}\n"
+        f"            {' ' * offset}^"
+    )
+
+
+def assert_has_all(sql: str, needles: Iterable[str]) -> None:
+    """Assert that every needle occurs in *sql*, scanning it once.
+
+    Needles that overlap another match can be shadowed in the single pass, so
+    anything not seen there is confirmed with a plain substring check.
+    """
+    wanted = set(needles)
+    found = set(re.findall("|".join(map(re.escape, wanted)), sql))
+    missing = sorted(n for n in wanted - found if n not in sql)
+    assert not missing, f"missing {missing} in SQL: {sql}"
@@ -1,50 +1,92 @@
 """Shared test fixtures."""
 
+from __future__ import annotations
+
+import tomllib
+from functools import cache
+from pathlib import Path
+
 import pytest
 
+from pycel2sql import analyze, convert, convert_parameterized
 from pycel2sql.dialect.bigquery import BigQueryDialect
 from pycel2sql.dialect.duckdb import DuckDBDialect
 from pycel2sql.dialect.mysql import MySQLDialect
 from pycel2sql.dialect.postgres import PostgresDialect
 from pycel2sql.dialect.spark import SparkDialect
 from pycel2sql.dialect.sqlite import SQLiteDialect
+from pycel2sql.schema import FieldSchema, Schema
+
+_STRING_CASES_PATH = Path(__file__).with_name("string_cases.toml")
+
+
+@cache
+def _string_cases() -> dict[str, list[dict[str, str]]]:
+    with _STRING_CASES_PATH.open("rb") as f:
+        return tomllib.load(f)
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize ``string_case`` from the string_cases.toml table named after the test."""
+    if "string_case" in metafunc.fixturenames:
+        cases = _string_cases()[metafunc.function.__name__]
+        metafunc.parametrize("string_case", cases, ids=[c["id"] for c in cases])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _warm_parser():
+    # The first conversion pays one-off parser and converter start-up cost, and
+    # analyze() imports the analysis and index-advisor modules lazily; take it
+    # all here rather than in whichever test happens to run first.
+    convert("true")
+    convert_parameterized("true")
+    analyze("true")
+
+
+@pytest.fixture(scope="session")
 def pg_dialect():
     return PostgresDialect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def duckdb_dialect():
     return DuckDBDialect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bigquery_dialect():
     return BigQueryDialect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mysql_dialect():
     return MySQLDialect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sqlite_dialect():
     return SQLiteDialect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spark_dialect():
     return SparkDialect()
 
 
-ALL_DIALECTS = [
-    PostgresDialect(),
-    DuckDBDialect(),
-    BigQueryDialect(),
-    MySQLDialect(),
-    SparkDialect(),
-    SQLiteDialect(),
-]
+@pytest.fixture(scope="session")
+def arr_schemas():
+    return {"t": Schema([FieldSchema("arr", repeated=True)])}
+
+
+@pytest.fixture(scope="session")
+def json_schemas():
+    return {"t": Schema([FieldSchema("data", is_json=True)])}
+
+
+@pytest.fixture(scope="session")
+def usr_metadata_schemas():
+    return {
+        "usr": Schema([
+            FieldSchema(name="metadata", type="jsonb", is_json=True, is_jsonb=True),
+        ]),
+    }
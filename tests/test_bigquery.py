@@ -20,11 +20,11 @@ class TestBigQueryLiterals:
     def test_string_with_quote(self, d):
         result = convert("name == \"it's\"", dialect=d)
         # BigQuery escapes with backslash
-        assert "\\'" in result
+        assert result == "name = 'it\\'s'"
 
     def test_bytes_literal(self, d):
         result = convert('b"abc" == data', dialect=d)
-        assert 'b"' in result
+        assert result == 'b"\\141\\142\\143" = data'
 
 
 class TestBigQueryParams:
@@ -33,10 +33,12 @@ class TestBigQueryParams:
         assert result.sql == "name = @p1"
         assert result.parameters == ["alice"]
 
-    def test_multiple_params(self, d):
-        result = convert_parameterized("age > 10 && age < 30", dialect=d)
-        assert "@p1" in result.sql
-        assert "@p2" in result.sql
+    @pytest.mark.parametrize("n", [1, 2, 5, 12])
+    def test_multiple_params(self, d, n):
+        expr = " && ".join(f"x{i} == {i}" for i in range(n))
+        result = convert_parameterized(expr, dialect=d)
+        assert result.sql == " AND ".join(f"x{i} = @p{i + 1}" for i in range(n))
+        assert result.parameters == list(range(n))
 
 
 class TestBigQueryArrays:
@@ -45,13 +47,13 @@ class TestBigQueryArrays:
 
     def test_array_membership(self, d):
         result = convert("x in [1, 2, 3]", dialect=d)
-        assert "IN UNNEST(" in result
+        assert result == "x IN UNNEST([1, 2, 3])"
 
     def test_array_index_const(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
         result = convert("t.arr[0]", dialect=d, schemas=schemas)
         # BigQuery: 0-indexed with OFFSET
-        assert "OFFSET(0)" in result
+        assert result == "t.arr[OFFSET(0)]"
 
     def test_array_length(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
@@ -60,72 +62,70 @@ class TestBigQueryArrays:
 
     def test_empty_typed_array(self, d):
         result = convert('"a,b".split(",", 0)', dialect=d)
-        assert "ARRAY<STRING>[]" in result
+        assert result == "ARRAY<STRING>[]"
 
 
 class TestBigQueryStringFunctions:
     def test_contains(self, d):
         result = convert('name.contains("test")', dialect=d)
-        assert "STRPOS(name, 'test') > 0" == result
+        assert result == "STRPOS(name, 'test') > 0"
 
     def test_starts_with(self, d):
         result = convert('name.startsWith("a")', dialect=d)
-        assert "LIKE 'a%'" in result
         # No ESCAPE clause in BigQuery
-        assert "ESCAPE" not in result
+        assert result == "name LIKE 'a%'"
 
     def test_split(self, d):
         result = convert('"a,b,c".split(",")', dialect=d)
-        assert "SPLIT(" in result
+        assert result == "SPLIT('a,b,c', ',')"
 
     def test_split_with_limit(self, d):
         result = convert('"a,b,c".split(",", 2)', dialect=d)
-        assert "UNNEST(SPLIT(" in result
-        assert "OFFSET < 2" in result
+        assert result == (
+            "ARRAY(SELECT x FROM UNNEST(SPLIT('a,b,c', ',')) AS x WITH OFFSET WHERE OFFSET < 2)"
+        )
 
     def test_join(self, d):
         result = convert('[1, 2, 3].join(",")', dialect=d)
-        assert "ARRAY_TO_STRING(" in result
+        assert result == "ARRAY_TO_STRING([1, 2, 3], ',')"
 
 
 class TestBigQueryRegex:
     def test_regex_match(self, d):
         result = convert('name.matches("^[a-z]+$")', dialect=d)
-        assert "REGEXP_CONTAINS(" in result
+        assert result == "REGEXP_CONTAINS(name, '^[a-z]+$')"
 
     def test_regex_case_insensitive(self, d):
         result = convert('name.matches("(?i)test")', dialect=d)
-        assert "REGEXP_CONTAINS(" in result
-        assert "(?i)" in result
+        assert result == "REGEXP_CONTAINS(name, '(?i)test')"
 
 
 class TestBigQueryTypeCasting:
     def test_type_name_string(self, d):
         result = convert('string(42)', dialect=d)
-        assert "STRING" in result
+        assert result == "CAST(42 AS STRING)"
 
     def test_type_name_int(self, d):
         result = convert('int(42)', dialect=d)
-        assert "INT64" in result
+        assert result == "CAST(42 AS INT64)"
 
     def test_epoch_extract(self, d):
         result = convert("int(created_at)", dialect=d)
-        assert "UNIX_SECONDS(" in result
+        assert result == "UNIX_SECONDS(created_at)"
 
     def test_timestamp_cast(self, d):
         result = convert('timestamp("2021-01-01T00:00:00Z")', dialect=d)
-        assert "CAST(" in result
-        assert "AS TIMESTAMP)" in result
+        assert result == "CAST('2021-01-01T00:00:00Z' AS TIMESTAMP)"
 
 
 class TestBigQueryTimestampArithmetic:
     def test_timestamp_add(self, d):
         result = convert('timestamp("2021-01-01T00:00:00Z") + duration("1h")', dialect=d)
-        assert "TIMESTAMP_ADD(" in result
+        assert result == "TIMESTAMP_ADD(CAST('2021-01-01T00:00:00Z' AS TIMESTAMP), INTERVAL 1 HOUR)"
 
     def test_timestamp_sub(self, d):
         result = convert('timestamp("2021-01-01T00:00:00Z") - duration("1h")', dialect=d)
-        assert "TIMESTAMP_SUB(" in result
+        assert result == "TIMESTAMP_SUB(CAST('2021-01-01T00:00:00Z' AS TIMESTAMP), INTERVAL 1 HOUR)"
 
 
 class TestBigQueryStruct:
@@ -138,9 +138,9 @@ class TestBigQueryComprehensions:
     def test_map(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
         result = convert("t.arr.map(x, x + 1)", dialect=d, schemas=schemas)
-        assert "ARRAY(SELECT" in result
+        assert result == "ARRAY(SELECT x + 1 FROM UNNEST(t.arr) AS x)"
 
     def test_exists(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
         result = convert("t.arr.exists(x, x > 5)", dialect=d, schemas=schemas)
-        assert "EXISTS" in result
+        assert result == "EXISTS (SELECT 1 FROM UNNEST(t.arr) AS x WHERE x > 5)"
@@ -1,8 +1,27 @@
 """Comprehension tests - ported from comprehensions_test.go."""
 
+import pytest
+
 from pycel2sql import convert
 from pycel2sql.schema import FieldSchema, Schema
 
+# SQL fragments shared by several expected outputs below.
+_LIKE_A_PREFIX_SQL = "LIKE 'a%' ESCAPE E'\\\\'"
+_UNNEST_CSV_SPLIT_SQL = "UNNEST(STRING_TO_ARRAY(person.csv, ','))"
+_UPPER_TAGS_MAP_SQL = "ARRAY(SELECT UPPER(t) FROM UNNEST(data.tags) AS t)"
+
+# Schemas are read-only during conversion, so one instance serves every test.
+_DATA_TAGS_SCHEMAS = {
+    "data": Schema([
+        FieldSchema(name="tags", type="text", repeated=True),
+    ]),
+}
+_PERSON_TAGS_SCHEMAS = {
+    "person": Schema([
+        FieldSchema(name="tags", type="text", repeated=True),
+    ]),
+}
+
 
 class TestComprehensionBasics:
     def test_all(self):
@@ -27,115 +46,110 @@ class TestComprehensionBasics:
 
 
 class TestComprehensionWithSchemaFields:
-    def _schemas(self):
-        return {
-            "data": Schema([
-                FieldSchema(name="tags", type="text", repeated=True),
-            ]),
-        }
-
     def test_exists_with_field(self):
         result = convert(
             "data.tags.exists(t, t == 'target')",
-            schemas=self._schemas(),
+            schemas=_DATA_TAGS_SCHEMAS,
         )
         assert result == "EXISTS (SELECT 1 FROM UNNEST(data.tags) AS t WHERE t = 'target')"
 
     def test_all_with_field(self):
         result = convert(
             "data.tags.all(t, t.size() > 0)",
-            schemas=self._schemas(),
+            schemas=_DATA_TAGS_SCHEMAS,
         )
         assert result == "NOT EXISTS (SELECT 1 FROM UNNEST(data.tags) AS t WHERE NOT (LENGTH(t) > 0))"
 
     def test_filter_with_field(self):
         result = convert(
             "data.tags.filter(t, t.startsWith('a')).size() > 0",
-            schemas=self._schemas(),
+            schemas=_DATA_TAGS_SCHEMAS,
+        )
+        assert result == (
+            "COALESCE(ARRAY_LENGTH(ARRAY(SELECT t FROM UNNEST(data.tags) AS t "
+            f"WHERE t {_LIKE_A_PREFIX_SQL}), 1), 0) > 0"
         )
-        assert result == "COALESCE(ARRAY_LENGTH(ARRAY(SELECT t FROM UNNEST(data.tags) AS t WHERE t LIKE 'a%' ESCAPE E'\\\\'), 1), 0) > 0"
 
     def test_map_with_field(self):
         result = convert(
             "data.tags.map(t, t.upperAscii())",
-            schemas=self._schemas(),
+            schemas=_DATA_TAGS_SCHEMAS,
         )
-        assert result == "ARRAY(SELECT UPPER(t) FROM UNNEST(data.tags) AS t)"
+        assert result == _UPPER_TAGS_MAP_SQL
 
 
 class TestComprehensionStringFunctions:
-    def _schemas(self):
-        return {
-            "data": Schema([
-                FieldSchema(name="tags", type="text", repeated=True),
-            ]),
-        }
-
     def test_size_in_exists_one(self):
         result = convert(
             "data.tags.exists_one(t, t.size() == 10)",
-            schemas=self._schemas(),
+            schemas=_DATA_TAGS_SCHEMAS,
         )
         assert result == "(SELECT COUNT(*) FROM UNNEST(data.tags) AS t WHERE LENGTH(t) = 10) = 1"
 
     def test_upper_in_map(self):
         result = convert(
             "data.tags.map(t, t.upperAscii())",
-            schemas=self._schemas(),
+            schemas=_DATA_TAGS_SCHEMAS,
         )
-        assert result == "ARRAY(SELECT UPPER(t) FROM UNNEST(data.tags) AS t)"
+        assert result == _UPPER_TAGS_MAP_SQL
 
     def test_lower_in_map(self):
         result = convert(
             "data.tags.map(t, t.lowerAscii())",
-            schemas=self._schemas(),
+            schemas=_DATA_TAGS_SCHEMAS,
         )
         assert result == "ARRAY(SELECT LOWER(t) FROM UNNEST(data.tags) AS t)"
 
     def test_size_in_filter(self):
         result = convert(
             "data.tags.filter(t, t.size() > 5)",
-            schemas=self._schemas(),
+            schemas=_DATA_TAGS_SCHEMAS,
         )
         assert result == "ARRAY(SELECT t FROM UNNEST(data.tags) AS t WHERE LENGTH(t) > 5)"
 
 
 class TestSplitInComprehensions:
-    def test_split_in_exists(self):
-        result = convert("person.csv.split(',').exists(x, x == 'target')")
-        assert result == "EXISTS (SELECT 1 FROM UNNEST(STRING_TO_ARRAY(person.csv, ',')) AS x WHERE x = 'target')"
-
-    def test_split_in_all(self):
-        result = convert("person.csv.split(',').all(x, x.size() > 0)")
-        assert result == "NOT EXISTS (SELECT 1 FROM UNNEST(STRING_TO_ARRAY(person.csv, ',')) AS x WHERE NOT (LENGTH(x) > 0))"
-
-    def test_split_in_filter(self):
-        result = convert("person.csv.split(',').filter(x, x.startsWith('a')).size() > 0")
-        assert result == "COALESCE(ARRAY_LENGTH(ARRAY(SELECT x FROM UNNEST(STRING_TO_ARRAY(person.csv, ',')) AS x WHERE x LIKE 'a%' ESCAPE E'\\\\'), 1), 0) > 0"
-
-    def test_split_in_map(self):
-        result = convert("person.csv.split(',').map(x, x.upperAscii())")
-        assert result == "ARRAY(SELECT UPPER(x) FROM UNNEST(STRING_TO_ARRAY(person.csv, ',')) AS x)"
+    @pytest.mark.parametrize("macro, expected", [
+        pytest.param(
+            "exists(x, x == 'target')",
+            f"EXISTS (SELECT 1 FROM {_UNNEST_CSV_SPLIT_SQL} AS x WHERE x = 'target')",
+            id="exists",
+        ),
+        pytest.param(
+            "all(x, x.size() > 0)",
+            f"NOT EXISTS (SELECT 1 FROM {_UNNEST_CSV_SPLIT_SQL} AS x WHERE NOT (LENGTH(x) > 0))",
+            id="all",
+        ),
+        pytest.param(
+            "filter(x, x.startsWith('a')).size() > 0",
+            f"COALESCE(ARRAY_LENGTH(ARRAY(SELECT x FROM {_UNNEST_CSV_SPLIT_SQL} AS x "
+            f"WHERE x {_LIKE_A_PREFIX_SQL}), 1), 0) > 0",
+            id="filter",
+        ),
+        pytest.param(
+            "map(x, x.upperAscii())",
+            f"ARRAY(SELECT UPPER(x) FROM {_UNNEST_CSV_SPLIT_SQL} AS x)",
+            id="map",
+        ),
+    ])
+    def test_split_in_comprehension(self, macro, expected):
+        assert convert(f"person.csv.split(',').{macro}") == expected
 
 
 class TestJoinWithComprehensions:
-    def _schemas(self):
-        return {
-            "person": Schema([
-                FieldSchema(name="tags", type="text", repeated=True),
-            ]),
-        }
-
     def test_join_filtered(self):
         result = convert(
             "person.tags.filter(t, t.startsWith('a')).join(',') == 'apple,apricot'",
-            schemas=self._schemas(),
+            schemas=_PERSON_TAGS_SCHEMAS,
+        )
+        assert result == (
+            "ARRAY_TO_STRING(ARRAY(SELECT t FROM UNNEST(person.tags) AS t "
+            f"WHERE t {_LIKE_A_PREFIX_SQL}), ',', '') = 'apple,apricot'"
         )
-        assert result == "ARRAY_TO_STRING(ARRAY(SELECT t FROM UNNEST(person.tags) AS t WHERE t LIKE 'a%' ESCAPE E'\\\\'), ',', '') = 'apple,apricot'"
 
     def test_join_mapped(self):
         result = convert(
             "person.tags.map(t, t.upperAscii()).join(',') == 'TAG1,TAG2'",
-            schemas=self._schemas(),
+            schemas=_PERSON_TAGS_SCHEMAS,
         )
         assert result == "ARRAY_TO_STRING(ARRAY(SELECT UPPER(t) FROM UNNEST(person.tags) AS t), ',', '') = 'TAG1,TAG2'"
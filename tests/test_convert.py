@@ -5,6 +5,10 @@ import pytest
 from pycel2sql import convert
 from pycel2sql._errors import ConversionError
 
+# PostgreSQL LIKE predicates shared by several expected outputs below.
+_NAME_STARTS_WITH_A_SQL = "name LIKE 'a%' ESCAPE E'\\\\'"
+_NAME_ENDS_WITH_Z_SQL = "name LIKE '%z' ESCAPE E'\\\\'"
+
 
 class TestBasicOperators:
     def test_equality(self):
@@ -47,18 +51,18 @@ class TestBasicOperators:
 class TestLogicalOperators:
     def test_and(self):
         result = convert('name.startsWith("a") && name.endsWith("z")')
-        assert result == "name LIKE 'a%' ESCAPE E'\\\\' AND name LIKE '%z' ESCAPE E'\\\\'"
+        assert result == f"{_NAME_STARTS_WITH_A_SQL} AND {_NAME_ENDS_WITH_Z_SQL}"
 
     def test_or(self):
         result = convert('name.startsWith("a") || name.endsWith("z")')
-        assert result == "name LIKE 'a%' ESCAPE E'\\\\' OR name LIKE '%z' ESCAPE E'\\\\'"
+        assert result == f"{_NAME_STARTS_WITH_A_SQL} OR {_NAME_ENDS_WITH_Z_SQL}"
 
     def test_not(self):
         assert convert("!adult") == "NOT adult"
 
     def test_parenthesized(self):
         result = convert('age >= 10 && (name.startsWith("a") || name.endsWith("z"))')
-        assert result == "age >= 10 AND (name LIKE 'a%' ESCAPE E'\\\\' OR name LIKE '%z' ESCAPE E'\\\\')"
+        assert result == f"age >= 10 AND ({_NAME_STARTS_WITH_A_SQL} OR {_NAME_ENDS_WITH_Z_SQL})"
 
 
 class TestArithmetic:
@@ -128,12 +132,12 @@ class TestContains:
 
 class TestStartsWith:
     def test_starts_with(self):
-        assert convert('name.startsWith("a")') == "name LIKE 'a%' ESCAPE E'\\\\'"
+        assert convert('name.startsWith("a")') == _NAME_STARTS_WITH_A_SQL
 
 
 class TestEndsWith:
     def test_ends_with(self):
-        assert convert('name.endsWith("z")') == "name LIKE '%z' ESCAPE E'\\\\'"
+        assert convert('name.endsWith("z")') == _NAME_ENDS_WITH_Z_SQL
 
 
 class TestMatches:
@@ -185,21 +189,15 @@ class TestSize:
 
 
 class TestNullByteSecurity:
-    def test_null_byte_in_string(self):
-        with pytest.raises(ConversionError, match="null bytes"):
-            convert('name == "test\\x00value"')
-
-    def test_null_byte_in_starts_with(self):
-        with pytest.raises(ConversionError, match="null bytes"):
-            convert('name.startsWith("\\x00test")')
-
-    def test_null_byte_in_ends_with(self):
-        with pytest.raises(ConversionError, match="null bytes"):
-            convert('name.endsWith("test\\x00")')
-
-    def test_null_byte_in_matches(self):
+    @pytest.mark.parametrize("expr", [
+        pytest.param('name == "test\\x00value"', id="string"),
+        pytest.param('name.startsWith("\\x00test")', id="starts_with"),
+        pytest.param('name.endsWith("test\\x00")', id="ends_with"),
+        pytest.param('name.matches("\\x00")', id="matches"),
+    ])
+    def test_null_byte_rejected(self, expr):
         with pytest.raises(ConversionError, match="null bytes"):
-            convert('name.matches("\\x00")')
+            convert(expr)
 
     def test_valid_string(self):
         assert convert('name == "valid"') == "name = 'valid'"
@@ -1,8 +1,11 @@
-"""Cross-dialect parametrized tests for expressions that should be identical."""
+"""Cross-dialect parametrized tests: shared expressions checked against per-dialect expected SQL."""
+
+import functools
 
 import pytest
 
 from pycel2sql import convert
+from pycel2sql.dialect._base import Dialect
 from pycel2sql.dialect.bigquery import BigQueryDialect
 from pycel2sql.dialect.duckdb import DuckDBDialect
 from pycel2sql.dialect.mysql import MySQLDialect
@@ -11,119 +14,201 @@ from pycel2sql.dialect.spark import SparkDialect
 from pycel2sql.dialect.sqlite import SQLiteDialect
 from pycel2sql.schema import FieldSchema, Schema
 
-ALL_DIALECTS = [
-    pytest.param(PostgresDialect(), id="postgres"),
-    pytest.param(DuckDBDialect(), id="duckdb"),
-    pytest.param(BigQueryDialect(), id="bigquery"),
-    pytest.param(MySQLDialect(), id="mysql"),
-    pytest.param(SparkDialect(), id="spark"),
-    pytest.param(SQLiteDialect(), id="sqlite"),
-]
-
-_DIALECTS_BY_ID = {
-    "postgres": PostgresDialect(),
-    "duckdb": DuckDBDialect(),
-    "bigquery": BigQueryDialect(),
-    "mysql": MySQLDialect(),
-    "spark": SparkDialect(),
-    "sqlite": SQLiteDialect(),
+_DIALECT_CLASSES: dict[str, type[Dialect]] = {
+    "postgres": PostgresDialect,
+    "duckdb": DuckDBDialect,
+    "bigquery": BigQueryDialect,
+    "mysql": MySQLDialect,
+    "spark": SparkDialect,
+    "sqlite": SQLiteDialect,
 }
 
+# Tests are parametrized by dialect name; instances are created on first use.
+ALL_DIALECTS = [pytest.param(name, id=name) for name in _DIALECT_CLASSES]
+
+
+@functools.cache
+def _dialect(name: str) -> Dialect:
+    return _DIALECT_CLASSES[name]()
+
 
 def _expected_params(expected: dict[str, str]):
     """Build parametrize args mapping a dialect to its expected SQL string."""
-    return [pytest.param(_DIALECTS_BY_ID[name], sql, id=name) for name, sql in expected.items()]
+    return [pytest.param(name, sql, id=name) for name, sql in expected.items()]
+
+
+# MySQL and SQLite both model arrays as JSON, so they are checked against the
+# same expressions: (case id, CEL expression, schemas fixture name or None,
+# {dialect: expected SQL}).
+_JSON_ARRAY_DIALECT_CASES = [
+    ("bytes_literal", 'b"abc" == data', None, {
+        "mysql": "X'616263' = data",
+        "sqlite": "X'616263' = data",
+    }),
+    ("array_literal", "[1, 2, 3]", None, {
+        "mysql": "JSON_ARRAY(1, 2, 3)",
+        "sqlite": "json_array(1, 2, 3)",
+    }),
+    ("array_membership", "x in [1, 2, 3]", None, {
+        "mysql": "JSON_CONTAINS(JSON_ARRAY(1, 2, 3), JSON_EXTRACT(JSON_ARRAY(x), '$[0]'))",
+        "sqlite": "x IN (SELECT value FROM json_each(json_array(1, 2, 3)))",
+    }),
+    ("array_index_const", "t.arr[0]", "arr_schemas", {
+        "mysql": "JSON_EXTRACT(t.arr, '$[0]')",
+        "sqlite": "json_extract(t.arr, '$[0]')",
+    }),
+    ("array_length", "t.arr.size()", "arr_schemas", {
+        "mysql": "COALESCE(JSON_LENGTH(t.arr), 0)",
+        "sqlite": "COALESCE(json_array_length(t.arr), 0)",
+    }),
+    ("contains", 'name.contains("test")', None, {
+        "mysql": "LOCATE('test', name) > 0",
+        "sqlite": "INSTR(name, 'test') > 0",
+    }),
+    ("starts_with", 'name.startsWith("a")', None, {
+        "mysql": "name LIKE 'a%' ESCAPE '\\\\'",
+        "sqlite": "name LIKE 'a%' ESCAPE '\\'",
+    }),
+    ("cast_to_numeric", "t.data.num > 5", "json_schemas", {
+        "mysql": "(t.data->>'$.num') + 0 > 5",
+        "sqlite": "(json_extract(t.data, '$.num')) + 0 > 5",
+    }),
+    ("type_name_int", "int(42)", None, {
+        "mysql": "CAST(42 AS SIGNED)",
+        "sqlite": "CAST(42 AS INTEGER)",
+    }),
+    ("epoch_extract", "int(created_at)", None, {
+        "mysql": "UNIX_TIMESTAMP(created_at)",
+        "sqlite": "CAST(strftime('%s', created_at) AS INTEGER)",
+    }),
+    ("timestamp_cast", 'timestamp("2021-01-01T00:00:00Z")', None, {
+        "mysql": "CAST('2021-01-01T00:00:00Z' AS DATETIME)",
+        "sqlite": "datetime('2021-01-01T00:00:00Z')",
+    }),
+    ("timestamp_arithmetic", 'timestamp("2021-01-01T00:00:00Z") + duration("1h")', None, {
+        "mysql": "CAST('2021-01-01T00:00:00Z' AS DATETIME) + INTERVAL 1 HOUR",
+        "sqlite": "datetime(datetime('2021-01-01T00:00:00Z'), '+1 hours')",
+    }),
+    ("extract_dow", "created_at.getDayOfWeek()", None, {
+        "mysql": "(DAYOFWEEK(created_at) + 5) % 7",
+        "sqlite": "CAST(strftime('%w', created_at) AS INTEGER)",
+    }),
+    ("json_field_access", "t.data.name", "json_schemas", {
+        "mysql": "t.data->>'$.name'",
+        "sqlite": "json_extract(t.data, '$.name')",
+    }),
+    ("json_existence", "has(t.data.name)", "json_schemas", {
+        "mysql": "JSON_CONTAINS_PATH(t.data, 'one', '$.name')",
+        "sqlite": "json_type(t.data, '$.name') IS NOT NULL",
+    }),
+    ("map", "t.arr.map(x, x + 1)", "arr_schemas", {
+        "mysql": "(SELECT JSON_ARRAYAGG(x + 1) FROM JSON_TABLE(t.arr, '$[*]' COLUMNS(value TEXT PATH '$')) AS x)",
+        "sqlite": "(SELECT json_group_array(x + 1) FROM json_each(t.arr) AS x)",
+    }),
+    ("filter", "t.arr.filter(x, x > 0)", "arr_schemas", {
+        "mysql": "(SELECT JSON_ARRAYAGG(x) FROM JSON_TABLE(t.arr, '$[*]' COLUMNS(value TEXT PATH '$')) AS x WHERE x > 0)",
+        "sqlite": "(SELECT json_group_array(x) FROM json_each(t.arr) AS x WHERE x > 0)",
+    }),
+    ("exists", "t.arr.exists(x, x > 5)", "arr_schemas", {
+        "mysql": "EXISTS (SELECT 1 FROM JSON_TABLE(t.arr, '$[*]' COLUMNS(value TEXT PATH '$')) AS x WHERE x > 5)",
+        "sqlite": "EXISTS (SELECT 1 FROM json_each(t.arr) AS x WHERE x > 5)",
+    }),
+    ("struct", '{"a": 1}', None, {
+        "mysql": "ROW(1)",
+        "sqlite": "json_object(1)",
+    }),
+]
 
 
 class TestNullComparisons:
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_is_null(self, dialect):
-        assert convert("null_var == null", dialect=dialect) == "null_var IS NULL"
+        assert convert("null_var == null", dialect=_dialect(dialect)) == "null_var IS NULL"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_is_not_null(self, dialect):
-        assert convert("null_var != null", dialect=dialect) == "null_var IS NOT NULL"
+        assert convert("null_var != null", dialect=_dialect(dialect)) == "null_var IS NOT NULL"
 
 
 class TestBoolComparisons:
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_is_true(self, dialect):
-        assert convert("adult == true", dialect=dialect) == "adult IS TRUE"
+        assert convert("adult == true", dialect=_dialect(dialect)) == "adult IS TRUE"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_is_not_true(self, dialect):
-        assert convert("adult != true", dialect=dialect) == "adult IS NOT TRUE"
+        assert convert("adult != true", dialect=_dialect(dialect)) == "adult IS NOT TRUE"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_is_false(self, dialect):
-        assert convert("adult == false", dialect=dialect) == "adult IS FALSE"
+        assert convert("adult == false", dialect=_dialect(dialect)) == "adult IS FALSE"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_is_not_false(self, dialect):
-        assert convert("adult != false", dialect=dialect) == "adult IS NOT FALSE"
+        assert convert("adult != false", dialect=_dialect(dialect)) == "adult IS NOT FALSE"
 
 
 class TestLogicalOperators:
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_not(self, dialect):
-        assert convert("!active", dialect=dialect) == "NOT active"
+        assert convert("!active", dialect=_dialect(dialect)) == "NOT active"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_and(self, dialect):
-        assert convert("age > 10 && age < 30", dialect=dialect) == "age > 10 AND age < 30"
+        assert convert("age > 10 && age < 30", dialect=_dialect(dialect)) == "age > 10 AND age < 30"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_or(self, dialect):
-        assert convert("age < 10 || age > 30", dialect=dialect) == "age < 10 OR age > 30"
+        assert convert("age < 10 || age > 30", dialect=_dialect(dialect)) == "age < 10 OR age > 30"
 
 
 class TestArithmetic:
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_addition(self, dialect):
-        assert convert("1 + 2 == 3", dialect=dialect) == "1 + 2 = 3"
+        assert convert("1 + 2 == 3", dialect=_dialect(dialect)) == "1 + 2 = 3"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_subtraction(self, dialect):
-        assert convert("5 - 3 == 2", dialect=dialect) == "5 - 3 = 2"
+        assert convert("5 - 3 == 2", dialect=_dialect(dialect)) == "5 - 3 = 2"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_multiplication(self, dialect):
-        assert convert("2 * 3 == 6", dialect=dialect) == "2 * 3 = 6"
+        assert convert("2 * 3 == 6", dialect=_dialect(dialect)) == "2 * 3 = 6"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_division(self, dialect):
-        assert convert("6 / 2 == 3", dialect=dialect) == "6 / 2 = 3"
+        assert convert("6 / 2 == 3", dialect=_dialect(dialect)) == "6 / 2 = 3"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_modulo(self, dialect):
-        assert convert("5 % 3 == 2", dialect=dialect) == "MOD(5, 3) = 2"
+        assert convert("5 % 3 == 2", dialect=_dialect(dialect)) == "MOD(5, 3) = 2"
 
 
 class TestTernary:
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_ternary(self, dialect):
-        result = convert("age > 18 ? true : false", dialect=dialect)
+        result = convert("age > 18 ? true : false", dialect=_dialect(dialect))
         assert result == "CASE WHEN age > 18 THEN TRUE ELSE FALSE END"
 
 
 class TestComparisonOperators:
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_less_than(self, dialect):
-        assert convert("age < 20", dialect=dialect) == "age < 20"
+        assert convert("age < 20", dialect=_dialect(dialect)) == "age < 20"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_greater_equal(self, dialect):
-        assert convert("age >= 20", dialect=dialect) == "age >= 20"
+        assert convert("age >= 20", dialect=_dialect(dialect)) == "age >= 20"
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_inequality(self, dialect):
-        assert convert("age != 20", dialect=dialect) == "age != 20"
+        assert convert("age != 20", dialect=_dialect(dialect)) == "age != 20"
 
 
 class TestNegation:
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_negative_number(self, dialect):
-        assert convert("-5 == x", dialect=dialect) == "-5 = x"
+        assert convert("-5 == x", dialect=_dialect(dialect)) == "-5 = x"
 
 
 class TestJSONArrayMembership:
@@ -147,12 +232,12 @@ class TestJSONArrayMembership:
         "sqlite": "EXISTS (SELECT 1 FROM json_each(t.tags) WHERE value = 'x')",
     }))
     def test_direct_jsonb_field(self, dialect, expected):
-        assert convert('"x" in t.tags', dialect=dialect, schemas=self._JSONB) == expected
+        assert convert('"x" in t.tags', dialect=_dialect(dialect), schemas=self._JSONB) == expected
 
     def test_direct_json_field_uses_json_func(self):
         # A plain (non-JSONB) JSON field selects json_array_elements_text on PG.
         assert (
-            convert('"x" in t.tags', dialect=PostgresDialect(), schemas=self._JSON)
+            convert('"x" in t.tags', dialect=_dialect("postgres"), schemas=self._JSON)
             == "'x' = ANY(ARRAY(SELECT json_array_elements_text(t.tags)))"
         )
 
@@ -165,14 +250,14 @@ class TestJSONArrayMembership:
         "sqlite": "EXISTS (SELECT 1 FROM json_each(json_extract(t.metadata, '$.tags')) WHERE value = 'x')",
     }))
     def test_nested_json_access(self, dialect, expected):
-        assert convert('"x" in t.metadata.tags', dialect=dialect, schemas=self._NESTED) == expected
+        assert convert('"x" in t.metadata.tags', dialect=_dialect(dialect), schemas=self._NESTED) == expected
 
     @pytest.mark.parametrize("dialect", ALL_DIALECTS)
     def test_non_json_field_unaffected(self, dialect):
         # No schema → plain array membership, never the JSON-membership predicate.
         # (SQLite/DuckDB plain membership uses `IN (SELECT value FROM json_each(...))`,
         # which is distinct from the new `EXISTS (... WHERE value = ...)` JSON path.)
-        result = convert("x in y", dialect=dialect)
+        result = convert("x in y", dialect=_dialect(dialect))
         for marker in (
             "EXISTS (SELECT 1 FROM json_each",
             "JSON_VALUE_ARRAY",
@@ -181,3 +266,14 @@ class TestJSONArrayMembership:
             "from_json",
         ):
             assert marker not in result
+
+
+class TestJSONArrayDialects:
+    @pytest.mark.parametrize("dialect, expr, schemas_fixture, expected", [
+        pytest.param(name, expr, schemas_fixture, sql, id=f"{case}-{name}")
+        for case, expr, schemas_fixture, expected in _JSON_ARRAY_DIALECT_CASES
+        for name, sql in expected.items()
+    ])
+    def test_convert(self, request, dialect, expr, schemas_fixture, expected):
+        schemas = request.getfixturevalue(schemas_fixture) if schemas_fixture else None
+        assert convert(expr, dialect=_dialect(dialect), schemas=schemas) == expected
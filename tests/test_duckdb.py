@@ -24,7 +24,7 @@ class TestDuckDBLiterals:
 
     def test_bytes_literal(self, d):
         result = convert('b"abc" == data', dialect=d)
-        assert "\\x" in result
+        assert result == "'\\x616263' = data"
 
 
 class TestDuckDBParams:
@@ -33,10 +33,12 @@ class TestDuckDBParams:
         assert result.sql == "name = $1"
         assert result.parameters == ["alice"]
 
-    def test_multiple_params(self, d):
-        result = convert_parameterized("age > 10 && age < 30", dialect=d)
-        assert "$1" in result.sql
-        assert "$2" in result.sql
+    @pytest.mark.parametrize("n", [1, 2, 5, 12])
+    def test_multiple_params(self, d, n):
+        expr = " && ".join(f"x{i} == {i}" for i in range(n))
+        result = convert_parameterized(expr, dialect=d)
+        assert result.sql == " AND ".join(f"x{i} = ${i + 1}" for i in range(n))
+        assert result.parameters == list(range(n))
 
 
 class TestDuckDBArrays:
@@ -50,12 +52,12 @@ class TestDuckDBArrays:
     def test_array_index_const(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
         result = convert("t.arr[0]", dialect=d, schemas=schemas)
-        assert "[1]" in result
+        assert result == "t.arr[1]"
 
     def test_array_length(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
         result = convert("t.arr.size()", dialect=d, schemas=schemas)
-        assert "COALESCE(array_length(" in result
+        assert result == "COALESCE(array_length(t.arr), 0)"
 
 
 class TestDuckDBStringFunctions:
@@ -65,18 +67,16 @@ class TestDuckDBStringFunctions:
 
     def test_starts_with(self, d):
         result = convert('name.startsWith("a")', dialect=d)
-        assert "LIKE 'a%'" in result
-        assert "ESCAPE '\\'" in result
-        assert "ESCAPE E" not in result  # No E prefix
+        assert result == "name LIKE 'a%' ESCAPE '\\'"  # No E prefix
 
     def test_split(self, d):
         result = convert('"a,b,c".split(",")', dialect=d)
-        assert "STRING_SPLIT(" in result
+        assert result == "STRING_SPLIT('a,b,c', ',')"
 
     def test_join(self, d):
         result = convert('[1, 2, 3].join(",")', dialect=d)
         # DuckDB ARRAY_TO_STRING has only 2 args (no empty string third arg)
-        assert "ARRAY_TO_STRING(" in result
+        assert result == "ARRAY_TO_STRING([1, 2, 3], ',')"
 
 
 class TestDuckDBRegex:
@@ -93,42 +93,40 @@ class TestDuckDBTypeCasting:
     def test_cast_to_numeric(self, d):
         schemas = {"t": Schema([FieldSchema("data", is_json=True)])}
         result = convert("t.data.num > 5", dialect=d, schemas=schemas)
-        assert "::DOUBLE" in result
+        assert result == "(t.data->>'num')::DOUBLE > 5"
 
     def test_type_name_string(self, d):
         result = convert('string(42)', dialect=d)
-        assert "VARCHAR" in result
+        assert result == "CAST(42 AS VARCHAR)"
 
     def test_type_name_double(self, d):
         result = convert('double(42)', dialect=d)
-        assert "DOUBLE" in result
+        assert result == "CAST(42 AS DOUBLE)"
 
     def test_epoch_extract(self, d):
         result = convert("int(created_at)", dialect=d)
-        assert "EXTRACT(EPOCH FROM" in result
-        assert "::BIGINT" in result
+        assert result == "EXTRACT(EPOCH FROM created_at)::BIGINT"
 
     def test_timestamp_cast(self, d):
         result = convert('timestamp("2021-01-01T00:00:00Z")', dialect=d)
-        assert "TIMESTAMPTZ" in result
+        assert result == "CAST('2021-01-01T00:00:00Z' AS TIMESTAMPTZ)"
 
 
 class TestDuckDBComprehensions:
     def test_map(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
         result = convert("t.arr.map(x, x + 1)", dialect=d, schemas=schemas)
-        assert "ARRAY(SELECT" in result
-        assert "UNNEST(" in result
+        assert result == "ARRAY(SELECT x + 1 FROM UNNEST(t.arr) AS x)"
 
     def test_filter(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
         result = convert("t.arr.filter(x, x > 0)", dialect=d, schemas=schemas)
-        assert "ARRAY(SELECT" in result
+        assert result == "ARRAY(SELECT x FROM UNNEST(t.arr) AS x WHERE x > 0)"
 
     def test_exists(self, d):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
         result = convert("t.arr.exists(x, x > 5)", dialect=d, schemas=schemas)
-        assert "EXISTS" in result
+        assert result == "EXISTS (SELECT 1 FROM UNNEST(t.arr) AS x WHERE x > 5)"
 
 
 class TestDuckDBStruct:
@@ -141,9 +139,9 @@ class TestDuckDBJSON:
     def test_json_field_access(self, d):
         schemas = {"t": Schema([FieldSchema("data", is_json=True)])}
         result = convert("t.data.name", dialect=d, schemas=schemas)
-        assert "->>" in result
+        assert result == "t.data->>'name'"
 
     def test_json_existence(self, d):
         schemas = {"t": Schema([FieldSchema("data", is_json=True)])}
         result = convert("has(t.data.name)", dialect=d, schemas=schemas)
-        assert "json_exists(" in result
+        assert result == "json_exists(t.data, '$.name')"
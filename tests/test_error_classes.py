@@ -23,6 +23,27 @@ from pycel2sql._errors import (
     UnsupportedTypeError,
 )
 
+ALL_ERROR_CLASSES = (
+    UnsupportedExpressionError,
+    InvalidFieldNameError,
+    InvalidSchemaError,
+    InvalidRegexPatternError,
+    MaxDepthExceededError,
+    MaxOutputLengthExceededError,
+    InvalidComprehensionError,
+    MaxComprehensionDepthExceededError,
+    InvalidArgumentsError,
+    UnsupportedOperationError,
+    InvalidTimestampOperationError,
+    InvalidDurationError,
+    InvalidJSONPathError,
+    InvalidOperatorError,
+    UnsupportedTypeError,
+    InvalidByteArrayLengthError,
+    UnsupportedDialectFeatureError,
+)
+ALL_ERROR_CLASS_IDS = [cls.__name__ for cls in ALL_ERROR_CLASSES]
+
 
 class TestConversionErrorBase:
     def test_str_returns_user_message(self):
@@ -50,40 +71,18 @@ class TestConversionErrorBase:
 class TestErrorHierarchy:
     """Test that all 17 subclasses are subclasses of ConversionError."""
 
-    ALL_ERROR_CLASSES = [
-        UnsupportedExpressionError,
-        InvalidFieldNameError,
-        InvalidSchemaError,
-        InvalidRegexPatternError,
-        MaxDepthExceededError,
-        MaxOutputLengthExceededError,
-        InvalidComprehensionError,
-        MaxComprehensionDepthExceededError,
-        InvalidArgumentsError,
-        UnsupportedOperationError,
-        InvalidTimestampOperationError,
-        InvalidDurationError,
-        InvalidJSONPathError,
-        InvalidOperatorError,
-        UnsupportedTypeError,
-        InvalidByteArrayLengthError,
-        UnsupportedDialectFeatureError,
-    ]
-
-    @pytest.mark.parametrize("cls", ALL_ERROR_CLASSES)
-    def test_is_subclass_of_conversion_error(self, cls):
+    @pytest.mark.parametrize("cls", ALL_ERROR_CLASSES, ids=ALL_ERROR_CLASS_IDS)
+    def test_error_class_contract(self, cls):
         assert issubclass(cls, ConversionError)
 
-    @pytest.mark.parametrize("cls", ALL_ERROR_CLASSES)
-    def test_instantiation(self, cls):
         err = cls("test message", "internal detail")
         assert str(err) == "test message"
         assert err.internal() == "internal detail"
 
-    @pytest.mark.parametrize("cls", ALL_ERROR_CLASSES)
-    def test_is_catchable_as_conversion_error(self, cls):
-        with pytest.raises(ConversionError):
-            raise cls("test")
+        try:
+            raise err
+        except ConversionError as caught:
+            assert caught is err
 
 
 class TestForwardLookingErrors:
@@ -94,19 +93,11 @@ class TestForwardLookingErrors:
         assert "bad schema" in str(err)
         assert "field 'x'" in err.internal()
 
-    def test_invalid_timestamp_operation_error(self):
-        err = InvalidTimestampOperationError("bad timestamp op")
-        assert isinstance(err, ConversionError)
-
     def test_invalid_json_path_error(self):
         err = InvalidJSONPathError("invalid JSON path", "path '$.x[' is malformed")
         assert err.user_message == "invalid JSON path"
         assert "malformed" in err.internal()
 
-    def test_invalid_operator_error(self):
-        err = InvalidOperatorError("invalid operator")
-        assert isinstance(err, ConversionError)
-
     def test_unsupported_type_error(self):
         err = UnsupportedTypeError("unsupported type", "type 'map' not supported")
         assert "unsupported type" in str(err)
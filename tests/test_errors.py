@@ -17,11 +17,46 @@ from pycel2sql._errors import (
 )
 from pycel2sql.schema import FieldSchema, Schema
 
+# Each failing conversion below is checked by several tests; convert it once per module.
+
+
+@pytest.fixture(scope="module")
+def max_depth_error():
+    with pytest.raises(MaxDepthExceededError) as exc_info:
+        convert("1 + 2 + 3 + 4 + 5 + 6 + 7 + 8", max_depth=5)
+    return exc_info.value
+
+
+@pytest.fixture(scope="module")
+def max_output_error():
+    with pytest.raises(MaxOutputLengthExceededError) as exc_info:
+        convert('name == "alice"', max_output_length=5)
+    return exc_info.value
+
+
+@pytest.fixture(scope="module")
+def byte_array_error():
+    # bytes literal > 10000 chars in non-parameterized mode
+    with pytest.raises(InvalidByteArrayLengthError) as exc_info:
+        convert(f'b"{"a" * 10001}" == data')
+    return exc_info.value
+
+
+@pytest.fixture(scope="module")
+def duration_error():
+    with pytest.raises(InvalidDurationError) as exc_info:
+        convert('duration("xyz")')
+    return exc_info.value
+
 
 class TestInvalidFieldNames:
     def test_reserved_keyword(self):
-        with pytest.raises(InvalidFieldNameError):
+        with pytest.raises(InvalidFieldNameError) as exc_info:
             convert('select == "test"')
+        # User message is sanitized; the offending name only appears internally
+        err = exc_info.value
+        assert str(err) == "field name is a reserved SQL keyword"
+        assert "select" in err.internal()
 
     def test_field_name_with_spaces(self):
         with pytest.raises(ConversionError):
@@ -30,50 +65,41 @@ class TestInvalidFieldNames:
 
 class TestReDoSProtection:
     def test_nested_quantifier(self):
-        with pytest.raises(InvalidRegexPatternError, match="ReDoS"):
+        with pytest.raises(InvalidRegexPatternError) as exc_info:
             convert('name.matches("(a+)+")')
+        assert "ReDoS" in str(exc_info.value)
 
     def test_pattern_too_long(self):
-        with pytest.raises(InvalidRegexPatternError, match="too long"):
+        with pytest.raises(InvalidRegexPatternError) as exc_info:
             convert(f'name.matches("{"a" * 600}")')
+        assert "too long" in str(exc_info.value)
 
     def test_nesting_too_deep(self):
         pattern = "(" * 15 + "a" + ")" * 15
-        with pytest.raises(InvalidRegexPatternError, match="nesting"):
+        with pytest.raises(InvalidRegexPatternError) as exc_info:
             convert(f'name.matches("{pattern}")')
-
-
-class TestDualMessaging:
-    def test_user_message_is_sanitized(self):
-        try:
-            convert('select == "test"')
-        except ConversionError as e:
-            assert "field name is a reserved SQL keyword" in str(e)
-            assert "select" not in str(e)
-            assert "select" in e.internal()
+        assert "nesting" in str(exc_info.value)
 
 
 class TestFormatErrors:
     def test_unsupported_specifier_b(self):
-        with pytest.raises(UnsupportedOperationError, match="unsupported format specifier %b"):
+        with pytest.raises(UnsupportedOperationError) as exc_info:
             convert("'Binary: %b'.format([5])")
+        assert "unsupported format specifier %b" in str(exc_info.value)
 
     def test_unsupported_specifier_x(self):
-        with pytest.raises(UnsupportedOperationError, match="unsupported format specifier %x"):
+        with pytest.raises(UnsupportedOperationError) as exc_info:
             convert("'Hex: %x'.format([255])")
+        assert "unsupported format specifier %x" in str(exc_info.value)
 
 
 class TestMaxDepthExceeded:
-    def test_shallow_depth_raises(self):
-        with pytest.raises(MaxDepthExceededError, match="maximum recursion depth exceeded"):
-            convert("1 + 2 + 3 + 4 + 5 + 6 + 7 + 8", max_depth=5)
+    def test_shallow_depth_raises(self, max_depth_error):
+        assert "maximum recursion depth exceeded" in str(max_depth_error)
 
-    def test_error_has_internal_details(self):
-        try:
-            convert("1 + 2 + 3 + 4 + 5 + 6 + 7 + 8", max_depth=5)
-        except MaxDepthExceededError as e:
-            assert "depth" in e.internal()
-            assert "exceeds limit" in e.internal()
+    def test_error_has_internal_details(self, max_depth_error):
+        assert "depth" in max_depth_error.internal()
+        assert "exceeds limit" in max_depth_error.internal()
 
     def test_normal_depth_succeeds(self):
         result = convert("1 + 2 + 3")
@@ -85,26 +111,19 @@ class TestMaxDepthExceeded:
 
 
 class TestMaxOutputLengthExceeded:
-    def test_tiny_limit_raises(self):
-        with pytest.raises(MaxOutputLengthExceededError, match="maximum SQL output length exceeded"):
-            convert('name == "alice"', max_output_length=5)
+    def test_tiny_limit_raises(self, max_output_error):
+        assert "maximum SQL output length exceeded" in str(max_output_error)
 
-    def test_error_has_internal_details(self):
-        try:
-            convert('name == "alice"', max_output_length=5)
-        except MaxOutputLengthExceededError as e:
-            assert "exceeds limit" in e.internal()
+    def test_error_has_internal_details(self, max_output_error):
+        assert "exceeds limit" in max_output_error.internal()
 
     def test_adequate_limit_succeeds(self):
         result = convert('name == "alice"', max_output_length=50000)
         assert result == "name = 'alice'"
 
-    def test_dual_messaging(self):
-        try:
-            convert('name == "alice"', max_output_length=5)
-        except MaxOutputLengthExceededError as e:
-            # User message should not contain sensitive implementation details
-            assert "maximum SQL output length exceeded" in str(e)
+    def test_dual_messaging(self, max_output_error):
+        # User message should not contain sensitive implementation details
+        assert "maximum SQL output length exceeded" in str(max_output_error)
 
 
 class TestMaxComprehensionDepthExceeded:
@@ -120,11 +139,12 @@ class TestMaxComprehensionDepthExceeded:
 
     def test_quadruple_nesting_fails(self):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
-        with pytest.raises(MaxComprehensionDepthExceededError, match="comprehension nesting"):
+        with pytest.raises(MaxComprehensionDepthExceededError) as exc_info:
             convert(
                 "t.arr.exists(x, t.arr.exists(y, t.arr.exists(z, t.arr.exists(w, w > 0))))",
                 schemas=schemas,
             )
+        assert "comprehension nesting" in str(exc_info.value)
 
     def test_error_has_internal_details(self):
         schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
@@ -139,11 +159,8 @@ class TestMaxComprehensionDepthExceeded:
 
 
 class TestInvalidByteArrayLength:
-    def test_huge_bytes_raises(self):
-        # bytes literal > 10000 chars in non-parameterized mode
-        large = "a" * 10001
-        with pytest.raises(InvalidByteArrayLengthError, match="byte array too long"):
-            convert(f'b"{large}" == data')
+    def test_huge_bytes_raises(self, byte_array_error):
+        assert "byte array too long" in str(byte_array_error)
 
     def test_at_limit_succeeds(self):
         large = "a" * 9999
@@ -157,26 +174,24 @@ class TestInvalidByteArrayLength:
 
 
 class TestInvalidDuration:
-    def test_unparseable_duration(self):
-        with pytest.raises(InvalidDurationError, match="invalid duration"):
-            convert('duration("xyz")')
+    def test_unparseable_duration(self, duration_error):
+        assert "invalid duration" in str(duration_error)
 
     def test_empty_duration(self):
-        with pytest.raises(InvalidDurationError, match="invalid duration"):
+        with pytest.raises(InvalidDurationError) as exc_info:
             convert('duration("")')
+        assert "invalid duration" in str(exc_info.value)
 
-    def test_dual_messaging(self):
-        try:
-            convert('duration("xyz")')
-        except InvalidDurationError as e:
-            assert "invalid duration" in str(e)
-            assert "xyz" in e.internal()
+    def test_dual_messaging(self, duration_error):
+        assert "invalid duration" in str(duration_error)
+        assert "xyz" in duration_error.internal()
 
 
 class TestUnsupportedExpressionError:
     def test_unknown_method(self):
-        with pytest.raises(UnsupportedExpressionError, match="unsupported method"):
+        with pytest.raises(UnsupportedExpressionError) as exc_info:
             convert("name.unknownMethod()")
+        assert "unsupported method" in str(exc_info.value)
 
     def test_unsupported_timestamp_method(self):
         with pytest.raises(UnsupportedExpressionError):
@@ -186,31 +201,19 @@ class TestUnsupportedExpressionError:
 class TestDualMessagingComprehensive:
     """CWE-209 verification: user messages should not leak internal details."""
 
-    def test_max_depth_no_leak(self):
-        try:
-            convert("1 + 2 + 3 + 4 + 5 + 6 + 7 + 8", max_depth=5)
-        except MaxDepthExceededError as e:
-            # Internal has specific numbers, user message is generic
-            assert "maximum recursion depth exceeded" == str(e)
-            assert "5" in e.internal()
+    def test_max_depth_no_leak(self, max_depth_error):
+        # Internal has specific numbers, user message is generic
+        assert str(max_depth_error) == "maximum recursion depth exceeded"
+        assert "5" in max_depth_error.internal()
 
-    def test_max_output_no_leak(self):
-        try:
-            convert('name == "alice"', max_output_length=5)
-        except MaxOutputLengthExceededError as e:
-            assert "maximum SQL output length exceeded" == str(e)
-            assert "5" in e.internal()
+    def test_max_output_no_leak(self, max_output_error):
+        assert str(max_output_error) == "maximum SQL output length exceeded"
+        assert "5" in max_output_error.internal()
 
-    def test_byte_array_no_leak(self):
-        try:
-            convert(f'b"{"a" * 10001}" == data')
-        except InvalidByteArrayLengthError as e:
-            assert "byte array too long" == str(e)
-            assert "10001" in e.internal()
+    def test_byte_array_no_leak(self, byte_array_error):
+        assert str(byte_array_error) == "byte array too long"
+        assert "10001" in byte_array_error.internal()
 
-    def test_duration_no_leak(self):
-        try:
-            convert('duration("xyz")')
-        except InvalidDurationError as e:
-            assert "invalid duration value" == str(e)
-            assert "xyz" in e.internal()
+    def test_duration_no_leak(self, duration_error):
+        assert str(duration_error) == "invalid duration value"
+        assert "xyz" in duration_error.internal()
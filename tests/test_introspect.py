@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+from collections.abc import Callable
 from typing import Any
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -22,66 +22,93 @@ from pycel2sql.introspect.sqlite import introspect_sqlite
 # ---------------------------------------------------------------------------
 
 
-def _make_pg_conn(rows: list[tuple[Any, ...]]) -> MagicMock:
-    cur = MagicMock()
-    cur.fetchall.return_value = rows
-    conn = MagicMock()
-    conn.cursor.return_value = cur
-    return conn
+class _StubCursor:
+    """Cursor returning canned rows and recording each executed query."""
 
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+        self.executed: list[tuple[str, Any]] = []
 
-def _make_duckdb_conn(rows: list[tuple[Any, ...]]) -> MagicMock:
-    result = MagicMock()
-    result.fetchall.return_value = rows
-    conn = MagicMock()
-    conn.execute.return_value = result
-    return conn
+    def execute(self, query: str, params: Any = None) -> _StubCursor:
+        self.executed.append((query, params))
+        return self
 
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return self.rows
 
-def _make_mysql_conn(rows: list[tuple[Any, ...]]) -> MagicMock:
-    cur = MagicMock()
-    cur.fetchall.return_value = rows
-    conn = MagicMock()
-    conn.cursor.return_value = cur
-    return conn
+    def close(self) -> None:
+        pass
 
 
-def _make_sqlite_conn(rows_by_table: dict[str, list[tuple[Any, ...]]]) -> MagicMock:
-    def execute_side_effect(query: str, *_: Any) -> MagicMock:
-        cursor = MagicMock()
-        for table_name, rows in rows_by_table.items():
-            if f"table_info({table_name})" in query:
-                cursor.fetchall.return_value = rows
-                return cursor
-        cursor.fetchall.return_value = []
-        return cursor
+class _StubConn:
+    """DB-API connection handing out a single shared cursor."""
 
-    conn = MagicMock()
-    conn.execute.side_effect = execute_side_effect
-    return conn
+    def __init__(self, cur: _StubCursor) -> None:
+        self.cur = cur
+
+    def cursor(self) -> _StubCursor:
+        return self.cur
+
+
+class _StubSQLiteConn:
+    """SQLite connection answering ``PRAGMA table_info(...)`` per table."""
+
+    def __init__(self, rows_by_table: dict[str, list[tuple[Any, ...]]]) -> None:
+        self.rows_by_table = rows_by_table
+
+    def execute(self, query: str, params: Any = None) -> _StubCursor:
+        # Pull the table name out of "PRAGMA table_info(<name>)" and look it up directly.
+        table_name = query.partition("table_info(")[2].partition(")")[0]
+        return _StubCursor(self.rows_by_table.get(table_name, []))
+
+
+def _make_pg_conn(rows: list[tuple[Any, ...]]) -> _StubConn:
+    return _StubConn(_StubCursor(rows))
+
+
+def _make_duckdb_conn(rows: list[tuple[Any, ...]]) -> _StubCursor:
+    # DuckDB connections execute directly and return a fetchable result.
+    return _StubCursor(rows)
+
+
+def _make_mysql_conn(rows: list[tuple[Any, ...]]) -> _StubConn:
+    return _StubConn(_StubCursor(rows))
+
+
+def _make_sqlite_conn(rows_by_table: dict[str, list[tuple[Any, ...]]]) -> _StubSQLiteConn:
+    return _StubSQLiteConn(rows_by_table)
 
 
-@dataclass
 class FakeSchemaField:
-    name: str
-    field_type: str
-    mode: str = "NULLABLE"
+    __slots__ = ("field_type", "mode", "name")
+
+    def __init__(self, name: str, field_type: str, mode: str = "NULLABLE") -> None:
+        self.name = name
+        self.field_type = field_type
+        self.mode = mode
 
 
-@dataclass
 class FakeTable:
-    schema: list[FakeSchemaField]
+    __slots__ = ("schema",)
+
+    def __init__(self, schema: list[FakeSchemaField]) -> None:
+        self.schema = schema
 
 
-def _make_bq_client(tables: dict[str, list[FakeSchemaField]]) -> MagicMock:
-    def get_table_side_effect(ref: str) -> FakeTable:
-        if ref in tables:
-            return FakeTable(schema=tables[ref])
+class _StubBQClient:
+    """BigQuery client serving tables from a ``dataset.table`` mapping."""
+
+    def __init__(self, tables: dict[str, list[FakeSchemaField]]) -> None:
+        self.tables = tables
+
+    def get_table(self, ref: str) -> FakeTable:
+        if ref in self.tables:
+            return FakeTable(schema=self.tables[ref])
         raise Exception(f"Not found: {ref}")
 
-    client = MagicMock()
-    client.get_table.side_effect = get_table_side_effect
-    return client
+
+def _make_bq_client(tables: dict[str, list[FakeSchemaField]]) -> _StubBQClient:
+    return _StubBQClient(tables)
 
 
 # ---------------------------------------------------------------------------
@@ -127,12 +154,9 @@ class TestPostgres:
 
     def test_table_not_found(self) -> None:
         conn = _make_pg_conn([])
-        with pytest.raises(IntrospectionError, match="table not found"):
+        with pytest.raises(IntrospectionError) as exc_info:
             introspect_postgres(conn, table_names=["missing"])
-
-    def test_empty_table_names(self) -> None:
-        conn = _make_pg_conn([])
-        assert introspect_postgres(conn, table_names=[]) == {}
+        assert "table not found" in str(exc_info.value)
 
     def test_custom_schema_name(self) -> None:
         rows = [("t1", "id", "integer", "int4")]
@@ -142,9 +166,8 @@ class TestPostgres:
         )
         assert "t1" in schemas
         # Verify schema_name was passed to query
-        cur = conn.cursor()
-        call_args = cur.execute.call_args
-        assert "myschema" in call_args[0][1]
+        _, params = conn.cursor().executed[-1]
+        assert "myschema" in params
 
     def test_multiple_tables(self) -> None:
         rows = [
@@ -194,12 +217,9 @@ class TestDuckDB:
 
     def test_table_not_found(self) -> None:
         conn = _make_duckdb_conn([])
-        with pytest.raises(IntrospectionError, match="table not found"):
+        with pytest.raises(IntrospectionError) as exc_info:
             introspect_duckdb(conn, table_names=["missing"])
-
-    def test_empty_table_names(self) -> None:
-        conn = _make_duckdb_conn([])
-        assert introspect_duckdb(conn, table_names=[]) == {}
+        assert "table not found" in str(exc_info.value)
 
 
 # ---------------------------------------------------------------------------
@@ -232,8 +252,9 @@ class TestMySQL:
 
     def test_table_not_found(self) -> None:
         conn = _make_mysql_conn([])
-        with pytest.raises(IntrospectionError, match="table not found"):
+        with pytest.raises(IntrospectionError) as exc_info:
             introspect_mysql(conn, table_names=["missing"])
+        assert "table not found" in str(exc_info.value)
 
     def test_explicit_database(self) -> None:
         rows = [("t1", "id", "int")]
@@ -242,13 +263,8 @@ class TestMySQL:
             conn, table_names=["t1"], database="mydb"
         )
         assert "t1" in schemas
-        cur = conn.cursor()
-        call_args = cur.execute.call_args
-        assert "mydb" in call_args[0][1]
-
-    def test_empty_table_names(self) -> None:
-        conn = _make_mysql_conn([])
-        assert introspect_mysql(conn, table_names=[]) == {}
+        _, params = conn.cursor().executed[-1]
+        assert "mydb" in params
 
 
 # ---------------------------------------------------------------------------
@@ -317,17 +333,15 @@ class TestSQLite:
 
     def test_table_not_found(self) -> None:
         conn = _make_sqlite_conn({})
-        with pytest.raises(IntrospectionError, match="table not found"):
+        with pytest.raises(IntrospectionError) as exc_info:
             introspect_sqlite(conn, table_names=["missing"])
+        assert "table not found" in str(exc_info.value)
 
     def test_invalid_table_name(self) -> None:
         conn = _make_sqlite_conn({})
-        with pytest.raises(IntrospectionError, match="invalid table name"):
+        with pytest.raises(IntrospectionError) as exc_info:
             introspect_sqlite(conn, table_names=["Robert'; DROP TABLE--"])
-
-    def test_empty_table_names(self) -> None:
-        conn = _make_sqlite_conn({})
-        assert introspect_sqlite(conn, table_names=[]) == {}
+        assert "invalid table name" in str(exc_info.value)
 
 
 # ---------------------------------------------------------------------------
@@ -375,65 +389,98 @@ class TestBigQuery:
 
     def test_unqualified_without_dataset(self) -> None:
         client = _make_bq_client({})
-        with pytest.raises(IntrospectionError, match="dataset required"):
+        with pytest.raises(IntrospectionError) as exc_info:
             introspect_bigquery(client, table_names=["t1"])
+        assert "dataset required" in str(exc_info.value)
 
     def test_table_not_found(self) -> None:
         client = _make_bq_client({})
-        with pytest.raises(IntrospectionError, match="table not found"):
+        with pytest.raises(IntrospectionError) as exc_info:
             introspect_bigquery(
                 client, table_names=["missing"], dataset="ds"
             )
-
-    def test_empty_table_names(self) -> None:
-        client = _make_bq_client({})
-        assert introspect_bigquery(client, table_names=[]) == {}
+        assert "table not found" in str(exc_info.value)
 
 
 # ---------------------------------------------------------------------------
-# Dispatch function
+# Empty table list (all dialects)
 # ---------------------------------------------------------------------------
 
 
-class TestDispatch:
-    def test_postgresql(self) -> None:
-        rows = [("t1", "id", "integer", "int4")]
-        conn = _make_pg_conn(rows)
-        schemas = introspect("postgresql", conn, table_names=["t1"])
-        assert "t1" in schemas
+class TestEmptyTableNames:
+    @pytest.mark.parametrize(
+        ("fn", "make_conn"),
+        [
+            pytest.param(introspect_postgres, lambda: _make_pg_conn([]), id="postgres"),
+            pytest.param(introspect_duckdb, lambda: _make_duckdb_conn([]), id="duckdb"),
+            pytest.param(introspect_mysql, lambda: _make_mysql_conn([]), id="mysql"),
+            pytest.param(introspect_sqlite, lambda: _make_sqlite_conn({}), id="sqlite"),
+            pytest.param(introspect_bigquery, lambda: _make_bq_client({}), id="bigquery"),
+            pytest.param(
+                functools.partial(introspect, "postgresql"),
+                lambda: _make_pg_conn([]),
+                id="dispatch",
+            ),
+        ],
+    )
+    def test_short_circuits(self, fn: Callable[..., Any], make_conn: Callable[[], Any]) -> None:
+        assert fn(make_conn(), table_names=[]) == {}
 
-    def test_duckdb(self) -> None:
-        rows = [("t1", "id", "INTEGER")]
-        conn = _make_duckdb_conn(rows)
-        schemas = introspect("duckdb", conn, table_names=["t1"])
-        assert "t1" in schemas
 
-    def test_mysql(self) -> None:
-        rows = [("t1", "id", "int")]
-        conn = _make_mysql_conn(rows)
-        schemas = introspect("mysql", conn, table_names=["t1"])
-        assert "t1" in schemas
+# ---------------------------------------------------------------------------
+# Dispatch function
+# ---------------------------------------------------------------------------
 
-    def test_sqlite(self) -> None:
-        rows_by_table = {"t1": [(0, "id", "INTEGER", 1, None, 1)]}
-        conn = _make_sqlite_conn(rows_by_table)
-        schemas = introspect("sqlite", conn, table_names=["t1"])
-        assert "t1" in schemas
 
-    def test_bigquery(self) -> None:
-        tables = {"ds.t1": [FakeSchemaField("id", "INTEGER")]}
-        client = _make_bq_client(tables)
-        schemas = introspect(
-            "bigquery", client, table_names=["t1"], dataset="ds"
-        )
+class TestDispatch:
+    @pytest.mark.parametrize(
+        ("dialect_name", "make_conn", "kwargs"),
+        [
+            pytest.param(
+                "postgresql",
+                lambda: _make_pg_conn([("t1", "id", "integer", "int4")]),
+                {},
+                id="postgresql",
+            ),
+            pytest.param(
+                "duckdb",
+                lambda: _make_duckdb_conn([("t1", "id", "INTEGER")]),
+                {},
+                id="duckdb",
+            ),
+            pytest.param(
+                "mysql",
+                lambda: _make_mysql_conn([("t1", "id", "int")]),
+                {},
+                id="mysql",
+            ),
+            pytest.param(
+                "sqlite",
+                lambda: _make_sqlite_conn({"t1": [(0, "id", "INTEGER", 1, None, 1)]}),
+                {},
+                id="sqlite",
+            ),
+            pytest.param(
+                "bigquery",
+                lambda: _make_bq_client({"ds.t1": [FakeSchemaField("id", "INTEGER")]}),
+                {"dataset": "ds"},
+                id="bigquery",
+            ),
+        ],
+    )
+    def test_dispatch(
+        self,
+        dialect_name: str,
+        make_conn: Callable[[], Any],
+        kwargs: dict[str, Any],
+    ) -> None:
+        schemas = introspect(dialect_name, make_conn(), table_names=["t1"], **kwargs)
         assert "t1" in schemas
 
     def test_unknown_dialect(self) -> None:
-        with pytest.raises(ValueError, match="unknown dialect"):
-            introspect("oracle", MagicMock(), table_names=["t1"])
-
-    def test_empty_table_names(self) -> None:
-        assert introspect("postgresql", MagicMock(), table_names=[]) == {}
+        with pytest.raises(ValueError) as exc_info:
+            introspect("oracle", object(), table_names=["t1"])
+        assert "unknown dialect" in str(exc_info.value)
 
 
 # ---------------------------------------------------------------------------
@@ -468,10 +515,11 @@ class TestLazyImports:
         assert callable(fn)
 
     def test_import_nonexistent_raises(self) -> None:
-        with pytest.raises(AttributeError, match="no attribute"):
+        with pytest.raises(AttributeError) as exc_info:
             from pycel2sql import introspect as mod
 
             mod.__getattr__("does_not_exist")
+        assert "no attribute" in str(exc_info.value)
 
 
 # ---------------------------------------------------------------------------
@@ -3,6 +3,8 @@
 Tests for InvalidArgumentsError which has ~30 raise sites in the converter.
 """
 
+import re
+
 import pytest
 
 from pycel2sql import convert
@@ -10,174 +12,53 @@ from pycel2sql._errors import (
     InvalidArgumentsError,
     UnsupportedOperationError,
 )
-from pycel2sql.schema import FieldSchema, Schema
-
-
-class TestStartsWith:
-    def test_non_string_arg_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="startsWith"):
-            convert("name.startsWith(123)")
-
-    def test_too_many_args(self):
-        # CEL parser may reject this; if it does, that's fine
-        with pytest.raises(Exception):
-            convert('name.startsWith("a", "b")')
-
-
-class TestEndsWith:
-    def test_non_string_arg_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="endsWith"):
-            convert("name.endsWith(123)")
-
-
-class TestMatches:
-    def test_non_string_arg_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="matches"):
-            convert("name.matches(123)")
-
-
-class TestCharAt:
-    def test_no_args_raises(self):
-        with pytest.raises(Exception):
-            convert("name.charAt()")
-
-    def test_too_many_args_raises(self):
-        with pytest.raises(Exception):
-            convert("name.charAt(1, 2)")
-
-
-class TestIndexOf:
-    def test_no_args_raises(self):
-        with pytest.raises(Exception):
-            convert("name.indexOf()")
-
-    def test_too_many_args_raises(self):
-        with pytest.raises(InvalidArgumentsError):
-            convert('name.indexOf("a", 0, 5)')
-
-
-class TestLastIndexOf:
-    def test_no_args_raises(self):
-        with pytest.raises(Exception):
-            convert("name.lastIndexOf()")
-
-
-class TestSubstring:
-    def test_no_args_raises(self):
-        with pytest.raises(Exception):
-            convert("name.substring()")
-
-    def test_too_many_args_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="substring"):
-            convert("name.substring(0, 5, 10)")
-
-
-class TestReplace:
-    def test_too_few_args(self):
-        with pytest.raises(InvalidArgumentsError, match="replace"):
-            convert('name.replace("a")')
-
-    def test_unsupported_limit(self):
-        with pytest.raises(UnsupportedOperationError, match="replace"):
-            convert('name.replace("a", "b", 2)')
-
-
-class TestSplit:
-    def test_no_args_raises(self):
-        with pytest.raises(Exception):
-            convert("name.split()")
-
-    def test_too_many_args_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="split"):
-            convert('name.split(",", 2, "extra")')
-
-    def test_non_int_limit_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="split"):
-            convert('name.split(",", "x")')
-
-    def test_negative_limit_raises(self):
-        with pytest.raises(UnsupportedOperationError, match="split"):
-            convert('name.split(",", -5)')
-
-
-class TestJoin:
-    def test_too_many_args_raises(self):
-        schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
-        with pytest.raises(InvalidArgumentsError, match="join"):
-            convert('t.arr.join(",", "extra")', schemas=schemas)
-
-
-class TestTimestampFunc:
-    def test_too_many_args_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="timestamp"):
-            convert('timestamp("a", "b", "c")')
-
-
-class TestDurationFunc:
-    def test_no_args_raises(self):
-        with pytest.raises(Exception):
-            convert("duration()")
-
-    def test_non_string_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="duration"):
-            convert("duration(123)")
-
-
-class TestIntervalFunc:
-    def test_wrong_arg_count_raises(self):
-        with pytest.raises(InvalidArgumentsError, match="interval"):
-            convert("interval(1)")
-
-
-class TestArrayIndex:
-    def test_negative_index_raises(self):
-        schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
-        with pytest.raises(InvalidArgumentsError, match="negative"):
-            convert("t.arr[-1]", schemas=schemas)
-
-    def test_overflow_index_raises(self):
-        schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
-        with pytest.raises(InvalidArgumentsError, match="overflow"):
-            convert("t.arr[9999999999]", schemas=schemas)
-
-
-class TestTypeCast:
-    def test_cast_wrong_arg_count(self):
-        with pytest.raises(Exception):
-            convert("int()")
-
-
-class TestContains:
-    def test_no_args_raises(self):
-        with pytest.raises(Exception):
-            convert("name.contains()")
-
-
-class TestFormatFunc:
-    def test_non_string_format(self):
-        # An identifier that is not a string literal format
-        with pytest.raises(InvalidArgumentsError, match="format"):
-            convert("name.format([1])")
-
-
-class TestHas:
-    def test_no_args_raises(self):
-        with pytest.raises(Exception):
-            convert("has()")
-
-
-class TestComprehensionArgs:
-    def test_all_wrong_arg_count(self):
-        schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
-        with pytest.raises(Exception):
-            convert("t.arr.all(x)", schemas=schemas)
-
-    def test_exists_wrong_arg_count(self):
-        schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
-        with pytest.raises(Exception):
-            convert("t.arr.exists(x)", schemas=schemas)
 
-    def test_filter_wrong_arg_count(self):
-        schemas = {"t": Schema([FieldSchema("arr", repeated=True)])}
-        with pytest.raises(Exception):
-            convert("t.arr.filter(x)", schemas=schemas)
+# e.g. "charAt() requires exactly 1 argument", "indexOf() requires 1 or 2 arguments"
+_ARITY_RE = re.compile(r"\(\) requires .*argument")
+
+# (CEL expression, schemas fixture name or None, expected error class,
+#  pattern searched in the user message)
+_ERROR_CASES = [
+    pytest.param("name.startsWith(123)", None, InvalidArgumentsError, "startsWith", id="startsWith_non_string"),
+    pytest.param("name.endsWith(123)", None, InvalidArgumentsError, "endsWith", id="endsWith_non_string"),
+    pytest.param("name.matches(123)", None, InvalidArgumentsError, "matches", id="matches_non_string"),
+    pytest.param('name.indexOf("a", 0, 5)', None, InvalidArgumentsError, "indexOf", id="indexOf_too_many"),
+    pytest.param("name.substring(0, 5, 10)", None, InvalidArgumentsError, "substring", id="substring_too_many"),
+    pytest.param('name.replace("a")', None, InvalidArgumentsError, "replace", id="replace_too_few"),
+    pytest.param('name.split(",", 2, "extra")', None, InvalidArgumentsError, "split", id="split_too_many"),
+    pytest.param('name.split(",", "x")', None, InvalidArgumentsError, "split", id="split_non_int_limit"),
+    pytest.param('t.arr.join(",", "extra")', "arr_schemas", InvalidArgumentsError, "join", id="join_too_many"),
+    pytest.param('timestamp("a", "b", "c")', None, InvalidArgumentsError, "timestamp", id="timestamp_too_many"),
+    pytest.param("duration(123)", None, InvalidArgumentsError, "duration", id="duration_non_string"),
+    pytest.param("interval(1)", None, InvalidArgumentsError, "interval", id="interval_wrong_count"),
+    pytest.param("t.arr[-1]", "arr_schemas", InvalidArgumentsError, "negative", id="array_negative_index"),
+    pytest.param("t.arr[9999999999]", "arr_schemas", InvalidArgumentsError, "overflow", id="array_overflow_index"),
+    # An identifier that is not a string literal format
+    pytest.param("name.format([1])", None, InvalidArgumentsError, "format", id="format_non_string"),
+    # Wrong argument counts
+    pytest.param('name.startsWith("a", "b")', None, InvalidArgumentsError, _ARITY_RE, id="startsWith_too_many"),
+    pytest.param("name.charAt()", None, InvalidArgumentsError, _ARITY_RE, id="charAt_none"),
+    pytest.param("name.charAt(1, 2)", None, InvalidArgumentsError, _ARITY_RE, id="charAt_too_many"),
+    pytest.param("name.indexOf()", None, InvalidArgumentsError, _ARITY_RE, id="indexOf_none"),
+    pytest.param("name.lastIndexOf()", None, InvalidArgumentsError, _ARITY_RE, id="lastIndexOf_none"),
+    pytest.param("name.substring()", None, InvalidArgumentsError, _ARITY_RE, id="substring_none"),
+    pytest.param("name.split()", None, InvalidArgumentsError, _ARITY_RE, id="split_none"),
+    pytest.param("duration()", None, InvalidArgumentsError, _ARITY_RE, id="duration_none"),
+    pytest.param("int()", None, InvalidArgumentsError, _ARITY_RE, id="cast_none"),
+    pytest.param("name.contains()", None, InvalidArgumentsError, _ARITY_RE, id="contains_none"),
+    pytest.param("has()", None, InvalidArgumentsError, _ARITY_RE, id="has_none"),
+    pytest.param("t.arr.all(x)", "arr_schemas", InvalidArgumentsError, _ARITY_RE, id="all_one_arg"),
+    pytest.param("t.arr.exists(x)", "arr_schemas", InvalidArgumentsError, _ARITY_RE, id="exists_one_arg"),
+    pytest.param("t.arr.filter(x)", "arr_schemas", InvalidArgumentsError, _ARITY_RE, id="filter_one_arg"),
+    # Valid arity, unsupported argument value
+    pytest.param('name.replace("a", "b", 2)', None, UnsupportedOperationError, "replace", id="replace_limit"),
+    pytest.param('name.split(",", -5)', None, UnsupportedOperationError, "split", id="split_negative_limit"),
+]
+
+
+class TestInvalidArguments:
+    @pytest.mark.parametrize("expr, schemas_fixture, exc, pattern", _ERROR_CASES)
+    def test_raises(self, request, expr, schemas_fixture, exc, pattern):
+        schemas = request.getfixturevalue(schemas_fixture) if schemas_fixture else None
+        with pytest.raises(exc, match=pattern):
+            convert(expr, schemas=schemas)
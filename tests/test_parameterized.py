@@ -4,44 +4,28 @@ import pytest
 
 from pycel2sql import convert_parameterized
 from pycel2sql._errors import ConversionError
-from pycel2sql.schema import FieldSchema, Schema
 
 
 class TestParameterizedBasic:
-    def test_string_equality(self):
-        result = convert_parameterized('name == "John"')
-        assert result.sql == "name = $1"
-        assert result.parameters == ["John"]
-
-    def test_multiple_string_params(self):
-        result = convert_parameterized('name == "John" && name != "Jane"')
-        assert result.sql == "name = $1 AND name != $2"
-        assert result.parameters == ["John", "Jane"]
-
-    def test_string_with_escaped_quotes(self):
-        result = convert_parameterized("name == \"O'Brien\"")
-        assert result.sql == "name = $1"
-        assert result.parameters == ["O'Brien"]
-
-    def test_integer_equality(self):
-        result = convert_parameterized("age == 18")
-        assert result.sql == "age = $1"
-        assert result.parameters == [18]
-
-    def test_integer_comparison(self):
-        result = convert_parameterized("age > 21 && age < 65")
-        assert result.sql == "age > $1 AND age < $2"
-        assert result.parameters == [21, 65]
-
-    def test_double_equality(self):
-        result = convert_parameterized("salary == 50000.50")
-        assert result.sql == "salary = $1"
-        assert result.parameters == [50000.50]
-
-    def test_double_comparison(self):
-        result = convert_parameterized("salary >= 30000.0 && salary <= 100000.0")
-        assert result.sql == "salary >= $1 AND salary <= $2"
-        assert result.parameters == [30000.0, 100000.0]
+    @pytest.mark.parametrize("expr, sql, params", [
+        pytest.param('name == "John"', "name = $1", ["John"], id="string_equality"),
+        pytest.param(
+            'name == "John" && name != "Jane"', "name = $1 AND name != $2", ["John", "Jane"],
+            id="multiple_string_params",
+        ),
+        pytest.param("name == \"O'Brien\"", "name = $1", ["O'Brien"], id="string_with_escaped_quotes"),
+        pytest.param("age == 18", "age = $1", [18], id="integer_equality"),
+        pytest.param("age > 21 && age < 65", "age > $1 AND age < $2", [21, 65], id="integer_comparison"),
+        pytest.param("salary == 50000.50", "salary = $1", [50000.50], id="double_equality"),
+        pytest.param(
+            "salary >= 30000.0 && salary <= 100000.0", "salary >= $1 AND salary <= $2", [30000.0, 100000.0],
+            id="double_comparison",
+        ),
+    ])
+    def test_basic(self, expr, sql, params):
+        result = convert_parameterized(expr)
+        assert result.sql == sql
+        assert result.parameters == params
 
 
 class TestParameterizedBooleans:
@@ -185,41 +169,26 @@ class TestParameterizedRegex:
 
 
 class TestParameterizedJSON:
-    def test_json_field_comparison(self):
-        schemas = {
-            "usr": Schema([
-                FieldSchema(name="metadata", type="jsonb", is_json=True, is_jsonb=True),
-            ]),
-        }
+    def test_json_field_comparison(self, usr_metadata_schemas):
         result = convert_parameterized(
             'usr.metadata.username == "john_doe"',
-            schemas=schemas,
+            schemas=usr_metadata_schemas,
         )
         assert result.sql == "usr.metadata->>'username' = $1"
         assert result.parameters == ["john_doe"]
 
-    def test_nested_json_comparison(self):
-        schemas = {
-            "usr": Schema([
-                FieldSchema(name="metadata", type="jsonb", is_json=True, is_jsonb=True),
-            ]),
-        }
+    def test_nested_json_comparison(self, usr_metadata_schemas):
         result = convert_parameterized(
             'usr.metadata.settings.theme == "dark"',
-            schemas=schemas,
+            schemas=usr_metadata_schemas,
         )
         assert result.sql == "usr.metadata->'settings'->>'theme' = $1"
         assert result.parameters == ["dark"]
 
-    def test_json_and_regular_field(self):
-        schemas = {
-            "usr": Schema([
-                FieldSchema(name="metadata", type="jsonb", is_json=True, is_jsonb=True),
-            ]),
-        }
+    def test_json_and_regular_field(self, usr_metadata_schemas):
         result = convert_parameterized(
             'usr.name == "John" && usr.metadata.age == "25"',
-            schemas=schemas,
+            schemas=usr_metadata_schemas,
         )
         assert result.sql == "usr.name = $1 AND usr.metadata->>'age' = $2"
         assert result.parameters == ["John", "25"]
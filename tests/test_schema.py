@@ -40,3 +40,9 @@ class TestSchema:
         assert field is not None
         assert field.is_json is True
         assert field.is_jsonb is True
+
+    def test_fieldschema_is_slotted(self):
+        assert not hasattr(FieldSchema(name="x", type="text"), "__dict__")
+
+    def test_schema_is_slotted(self):
+        assert not hasattr(Schema([FieldSchema(name="x")]), "__dict__")
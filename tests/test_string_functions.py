@@ -1,175 +1,104 @@
 """String function tests - ported from string_functions_test.go."""
 
+import re
+
 import pytest
 
 from pycel2sql import convert
 from pycel2sql._errors import UnsupportedOperationError
+from tests._helpers import assert_sql_eq
 
+# Error-message patterns, compiled once for pytest.raises(match=...)
+_REPLACE_LIMIT_RE = re.compile(r"replace.*limit")
+_SPLIT_NEGATIVE_LIMIT_RE = re.compile(r"split.*negative limit")
+_FORMAT_RE = re.compile(r"format")
 
-class TestLowerAscii:
-    def test_method_call(self):
-        result = convert("person.name.lowerAscii() == 'john'")
-        assert result == "LOWER(person.name) = 'john'"
 
-    def test_with_comparison(self):
-        result = convert("person.email.lowerAscii() == person.username.lowerAscii()")
-        assert result == "LOWER(person.email) = LOWER(person.username)"
+class TestLowerAscii:
+    def test_lower_ascii(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
 
 
 class TestUpperAscii:
-    def test_method_call(self):
-        result = convert("person.name.upperAscii() == 'JOHN'")
-        assert result == "UPPER(person.name) = 'JOHN'"
-
-    def test_with_starts_with(self):
-        result = convert("person.name.upperAscii().startsWith('J')")
-        assert result == "UPPER(person.name) LIKE 'J%' ESCAPE E'\\\\'"
+    def test_upper_ascii(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
 
 
 class TestTrim:
-    def test_method_call(self):
-        result = convert("person.name.trim() == 'John'")
-        assert result == "TRIM(person.name) = 'John'"
-
-    def test_in_comparison(self):
-        result = convert("person.name.trim().size() > 0")
-        assert result == "LENGTH(TRIM(person.name)) > 0"
+    def test_trim(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
 
 
 class TestCharAt:
-    def test_constant_index(self):
-        result = convert("person.name.charAt(0) == 'J'")
-        assert result == "SUBSTRING(person.name, 1, 1) = 'J'"
-
-    def test_dynamic_index(self):
-        result = convert("person.name.charAt(person.position) == 'x'")
-        assert result == "SUBSTRING(person.name, person.position + 1, 1) = 'x'"
+    def test_char_at(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
 
 
 class TestIndexOf:
-    def test_simple(self):
-        result = convert("person.email.indexOf('@') > 0")
-        assert result == "CASE WHEN POSITION('@' IN person.email) > 0 THEN POSITION('@' IN person.email) - 1 ELSE -1 END > 0"
-
-    def test_with_offset(self):
-        result = convert("person.text.indexOf('test', 5) >= 0")
-        assert result == "CASE WHEN POSITION('test' IN SUBSTRING(person.text, 6)) > 0 THEN POSITION('test' IN SUBSTRING(person.text, 6)) + 5 - 1 ELSE -1 END >= 0"
+    def test_index_of(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
 
 
 class TestLastIndexOf:
     def test_simple(self):
-        result = convert("person.path.lastIndexOf('/') > 0")
-        assert result == "CASE WHEN POSITION(REVERSE('/') IN REVERSE(person.path)) > 0 THEN LENGTH(person.path) - POSITION(REVERSE('/') IN REVERSE(person.path)) - LENGTH('/') + 1 ELSE -1 END > 0"
+        assert_sql_eq(convert("person.path.lastIndexOf('/') > 0"), "CASE WHEN POSITION(REVERSE('/') IN REVERSE(person.path)) > 0 THEN LENGTH(person.path) - POSITION(REVERSE('/') IN REVERSE(person.path)) - LENGTH('/') + 1 ELSE -1 END > 0")
 
 
 class TestSubstring:
-    def test_start_only_constant(self):
-        result = convert("person.name.substring(5) == 'test'")
-        assert result == "SUBSTRING(person.name, 6) = 'test'"
-
-    def test_start_and_end_constant(self):
-        result = convert("person.name.substring(0, 4) == 'John'")
-        assert result == "SUBSTRING(person.name, 1, 4) = 'John'"
-
-    def test_dynamic_start(self):
-        result = convert("person.name.substring(person.startpos, person.endpos) == 'test'")
-        assert result == "SUBSTRING(person.name, person.startpos + 1, person.endpos - (person.startpos)) = 'test'"
+    def test_substring(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
 
 
 class TestReplace:
-    def test_without_limit(self):
-        result = convert("person.text.replace('old', 'new') == 'test'")
-        assert result == "REPLACE(person.text, 'old', 'new') = 'test'"
-
-    def test_with_limit_minus_one(self):
-        result = convert("person.text.replace('a', 'b', -1) == 'test'")
-        assert result == "REPLACE(person.text, 'a', 'b') = 'test'"
-
     def test_with_limit_error(self):
-        with pytest.raises(UnsupportedOperationError, match="replace.*limit"):
+        with pytest.raises(UnsupportedOperationError, match=_REPLACE_LIMIT_RE):
             convert("person.text.replace('a', 'b', 1) == 'test'")
 
+    def test_replace(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
+
 
 class TestReverse:
     def test_simple(self):
-        result = convert("person.name.reverse() == 'nhoJ'")
-        assert result == "REVERSE(person.name) = 'nhoJ'"
+        assert_sql_eq(convert("person.name.reverse() == 'nhoJ'"), "REVERSE(person.name) = 'nhoJ'")
 
 
 class TestSplit:
-    def test_basic(self):
-        result = convert("'a,b,c'.split(',') == ['a', 'b', 'c']")
-        assert result == "STRING_TO_ARRAY('a,b,c', ',') = ARRAY['a', 'b', 'c']"
-
-    def test_with_limit_minus_one(self):
-        result = convert("'a,b,c,d'.split(',', -1) == ['a', 'b', 'c', 'd']")
-        assert result == "STRING_TO_ARRAY('a,b,c,d', ',') = ARRAY['a', 'b', 'c', 'd']"
-
-    def test_with_limit_zero(self):
-        result = convert("'a,b,c'.split(',', 0).size() == 0")
-        assert result == "COALESCE(ARRAY_LENGTH(ARRAY[]::text[], 1), 0) = 0"
-
-    def test_with_limit_one(self):
-        result = convert("'a,b,c'.split(',', 1) == ['a,b,c']")
-        assert result == "ARRAY['a,b,c'] = ARRAY['a,b,c']"
-
-    def test_with_limit_two(self):
-        result = convert("'a,b,c,d'.split(',', 2).size() == 2")
-        assert result == "COALESCE(ARRAY_LENGTH((STRING_TO_ARRAY('a,b,c,d', ','))[1:2], 1), 0) = 2"
-
-    def test_with_limit_three(self):
-        result = convert("'one;two;three;four'.split(';', 3) == ['one', 'two', 'three']")
-        assert result == "(STRING_TO_ARRAY('one;two;three;four', ';'))[1:3] = ARRAY['one', 'two', 'three']"
-
-    def test_with_space_delimiter(self):
-        result = convert("'hello world'.split(' ') == ['hello', 'world']")
-        assert result == "STRING_TO_ARRAY('hello world', ' ') = ARRAY['hello', 'world']"
-
     def test_negative_limit_error(self):
-        with pytest.raises(UnsupportedOperationError, match="split.*negative limit"):
+        with pytest.raises(UnsupportedOperationError, match=_SPLIT_NEGATIVE_LIMIT_RE):
             convert("'a,b,c'.split(',', -2)")
 
+    def test_split(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
 
-class TestJoin:
-    def test_basic_with_delimiter(self):
-        result = convert("['a', 'b', 'c'].join(',') == 'a,b,c'")
-        assert result == "ARRAY_TO_STRING(ARRAY['a', 'b', 'c'], ',', '') = 'a,b,c'"
-
-    def test_without_delimiter(self):
-        result = convert("['a', 'b', 'c'].join() == 'abc'")
-        assert result == "ARRAY_TO_STRING(ARRAY['a', 'b', 'c'], '', '') = 'abc'"
 
-    def test_with_space(self):
-        result = convert("['hello', 'world'].join(' ') == 'hello world'")
-        assert result == "ARRAY_TO_STRING(ARRAY['hello', 'world'], ' ', '') = 'hello world'"
+class TestJoin:
+    def test_join(self, string_case):
+        assert_sql_eq(convert(string_case["expr"]), string_case["expected"])
 
 
 class TestFormatPerDialect:
     """format() dispatches per dialect: FORMAT for Postgres/BigQuery,
     format_string for Spark, printf for SQLite/DuckDB, raises for MySQL."""
 
+    def test_mysql_raises(self):
+        from pycel2sql._errors import UnsupportedDialectFeatureError
+        from pycel2sql.dialect.mysql import MySQLDialect
+        with pytest.raises(UnsupportedDialectFeatureError, match=_FORMAT_RE):
+            convert("'%s'.format([name])", dialect=MySQLDialect())
+
     def test_postgres_emits_FORMAT(self):
         from pycel2sql.dialect.postgres import PostgresDialect
-        result = convert("'%s = %d'.format([name, 10])", dialect=PostgresDialect())
-        assert result == "FORMAT('%s = %s', name, 10)"
+        assert_sql_eq(convert("'%s = %d'.format([name, 10])", dialect=PostgresDialect()), "FORMAT('%s = %s', name, 10)")
 
     def test_bigquery_emits_FORMAT(self):
         from pycel2sql.dialect.bigquery import BigQueryDialect
-        result = convert("'%s = %d'.format([name, 10])", dialect=BigQueryDialect())
-        assert result == "FORMAT('%s = %s', name, 10)"
+        assert_sql_eq(convert("'%s = %d'.format([name, 10])", dialect=BigQueryDialect()), "FORMAT('%s = %s', name, 10)")
 
     def test_sqlite_emits_printf(self):
         from pycel2sql.dialect.sqlite import SQLiteDialect
-        result = convert("'%s = %d'.format([name, 10])", dialect=SQLiteDialect())
-        assert result == "printf('%s = %s', name, 10)"
+        assert_sql_eq(convert("'%s = %d'.format([name, 10])", dialect=SQLiteDialect()), "printf('%s = %s', name, 10)")
 
     def test_duckdb_emits_printf(self):
         from pycel2sql.dialect.duckdb import DuckDBDialect
-        result = convert("'%s = %d'.format([name, 10])", dialect=DuckDBDialect())
-        assert result == "printf('%s = %s', name, 10)"
-
-    def test_mysql_raises(self):
-        from pycel2sql._errors import UnsupportedDialectFeatureError
-        from pycel2sql.dialect.mysql import MySQLDialect
-        with pytest.raises(UnsupportedDialectFeatureError, match="format"):
-            convert("'%s'.format([name])", dialect=MySQLDialect())
+        assert_sql_eq(convert("'%s = %d'.format([name, 10])", dialect=DuckDBDialect()), "printf('%s = %s', name, 10)")
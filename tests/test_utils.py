@@ -1,5 +1,7 @@
 """Utility function tests."""
 
+import re
+
 import pytest
 
 from pycel2sql._errors import InvalidFieldNameError
@@ -11,6 +13,8 @@ from pycel2sql._utils import (
     validate_no_null_bytes,
 )
 
+_NULL_BYTES_RE = re.compile(r"null bytes")
+
 
 class TestValidateFieldName:
     def test_valid_name(self):
@@ -28,9 +32,10 @@ class TestValidateFieldName:
         with pytest.raises(InvalidFieldNameError):
             validate_field_name("my field")
 
-    def test_reserved_keyword(self):
+    @pytest.mark.parametrize("kw", ["select", "from", "where", "join", "group", "order", "SELECT"])
+    def test_reserved_keyword(self, kw):
         with pytest.raises(InvalidFieldNameError):
-            validate_field_name("select")
+            validate_field_name(kw)
 
     def test_starts_with_number(self):
         with pytest.raises(InvalidFieldNameError):
@@ -53,6 +58,12 @@ class TestEscapeLikePattern:
     def test_single_quote(self):
         assert escape_like_pattern("it's") == "it''s"
 
+    def test_mixed(self):
+        assert escape_like_pattern("a%b_c\\d'e") == "a\\%b\\_c\\\\d''e"
+
+    def test_long_input(self):
+        assert escape_like_pattern("a%b_c\\" * 100_000) == "a\\%b\\_c\\\\" * 100_000
+
 
 class TestEscapeStringLiteral:
     def test_no_special_chars(self):
@@ -63,35 +74,20 @@ class TestEscapeStringLiteral:
 
 
 class TestConvertRE2ToPOSIX:
-    def test_simple_pattern(self):
-        pattern, ci = convert_re2_to_posix("a+")
-        assert pattern == "a+"
-        assert ci is False
-
-    def test_case_insensitive(self):
-        pattern, ci = convert_re2_to_posix("(?i)hello")
-        assert pattern == "hello"
-        assert ci is True
-
-    def test_digit_class(self):
-        pattern, ci = convert_re2_to_posix(r"\d+")
-        assert pattern == "[[:digit:]]+"
-
-    def test_word_class(self):
-        pattern, ci = convert_re2_to_posix(r"\w+")
-        assert pattern == "[[:alnum:]_]+"
-
-    def test_space_class(self):
-        pattern, ci = convert_re2_to_posix(r"\s+")
-        assert pattern == "[[:space:]]+"
-
-    def test_word_boundary(self):
-        pattern, ci = convert_re2_to_posix(r"\bword\b")
-        assert pattern == r"\yword\y"
-
-    def test_non_capturing_group(self):
-        pattern, ci = convert_re2_to_posix("(?:abc)")
-        assert pattern == "(abc)"
+    @pytest.mark.parametrize("re2, expected, expected_ci", [
+        pytest.param("a+", "a+", False, id="simple_pattern"),
+        pytest.param("(?i)hello", "hello", True, id="case_insensitive"),
+        pytest.param(r"\d+", "[[:digit:]]+", False, id="digit_class"),
+        pytest.param(r"\w+", "[[:alnum:]_]+", False, id="word_class"),
+        pytest.param(r"\s+", "[[:space:]]+", False, id="space_class"),
+        pytest.param(r"\bword\b", r"\yword\y", False, id="word_boundary"),
+        pytest.param("(?:abc)", "(abc)", False, id="non_capturing_group"),
+        pytest.param(r"(?i)\d(?:\s\B)", "[[:digit:]]([[:space:]]\\Y)", True, id="case_insensitive_mixed"),
+    ])
+    def test_convert(self, re2, expected, expected_ci):
+        pattern, ci = convert_re2_to_posix(re2)
+        assert pattern == expected
+        assert ci is expected_ci
 
 
 class TestValidateNoNullBytes:
@@ -99,5 +95,12 @@ class TestValidateNoNullBytes:
         validate_no_null_bytes("hello")
 
     def test_null_byte(self):
-        with pytest.raises(InvalidFieldNameError, match="null bytes"):
+        with pytest.raises(InvalidFieldNameError, match=_NULL_BYTES_RE):
             validate_no_null_bytes("hel\x00lo")
+
+    def test_long_clean_string(self):
+        validate_no_null_bytes("x" * 10_000_000)
+
+    def test_long_with_null_at_end(self):
+        with pytest.raises(InvalidFieldNameError, match=_NULL_BYTES_RE):
+            validate_no_null_bytes("x" * 10_000_000 + "\x00")
@@ -2,30 +2,39 @@
 
 import pytest
 
-from pycel2sql import analyze, convert, convert_parameterized
+from pycel2sql import AnalysisResult, Result, analyze, convert, convert_parameterized
 from pycel2sql._errors import InvalidSchemaError
 from pycel2sql.schema import FieldSchema, Schema
+from tests._helpers import assert_has_all
 
+# FieldSchema is a frozen dataclass, so one instance per column can be shared.
+_NAME = FieldSchema(name="name", type="text")
+_AGE = FieldSchema(name="age", type="integer")
+_METADATA = FieldSchema(name="metadata", type="jsonb", is_jsonb=True)
+_TAGS = FieldSchema(name="tags", type="text", repeated=True)
 
-def _make_schemas() -> dict[str, Schema]:
-    return {
-        "usr": Schema([
-            FieldSchema(name="name", type="text"),
-            FieldSchema(name="age", type="integer"),
-            FieldSchema(name="metadata", type="jsonb", is_jsonb=True),
-            FieldSchema(name="tags", type="text", repeated=True),
-        ]),
-    }
+
+_ENTRY_POINTS = [
+    pytest.param(convert, id="convert"),
+    pytest.param(convert_parameterized, id="convert_parameterized"),
+    pytest.param(analyze, id="analyze"),
+]
+
+
+def _sql(result: str | Result | AnalysisResult) -> str:
+    # convert() returns the SQL itself; the other entry points wrap it.
+    return result if isinstance(result, str) else result.sql
+
+
+@pytest.fixture(scope="module")
+def schemas():
+    # Shared by every test in the module; no test mutates it.
+    return {"usr": Schema([_NAME, _AGE, _METADATA, _TAGS])}
 
 
 class TestValidateSchemaConfig:
     """Tests for validate_schema configuration."""
 
-    def test_default_false_allows_unknown_fields(self):
-        """Default validate_schema=False allows unknown fields."""
-        result = convert("usr.nonexistent == 'foo'")
-        assert "usr.nonexistent" in result
-
     def test_true_with_no_schemas_raises(self):
         """validate_schema=True with no schemas raises immediately."""
         with pytest.raises(InvalidSchemaError):
@@ -36,9 +45,13 @@ class TestValidateSchemaConfig:
         with pytest.raises(InvalidSchemaError):
             convert("usr.name == 'foo'", schemas={}, validate_schema=True)
 
-    def test_false_with_schemas_allows_unknown(self):
+    def test_default_false_allows_unknown_fields(self):
+        """Default validate_schema=False allows unknown fields."""
+        result = convert("usr.nonexistent == 'foo'")
+        assert "usr.nonexistent" in result
+
+    def test_false_with_schemas_allows_unknown(self, schemas):
         """validate_schema=False with schemas still allows unknown fields."""
-        schemas = _make_schemas()
         result = convert("usr.nonexistent == 'foo'", schemas=schemas, validate_schema=False)
         assert "usr.nonexistent" in result
 
@@ -46,57 +59,46 @@ class TestValidateSchemaConfig:
 class TestValidateSchemaFieldAccess:
     """Tests for field access validation."""
 
-    def test_valid_field_succeeds(self):
-        """Known field passes validation."""
-        schemas = _make_schemas()
-        result = convert("usr.name == 'alice'", schemas=schemas, validate_schema=True)
-        assert "usr.name" in result
-
-    def test_unknown_field_raises(self):
-        """Unknown field raises InvalidSchemaError."""
-        schemas = _make_schemas()
-        with pytest.raises(InvalidSchemaError) as exc_info:
-            convert("usr.email == 'test@example.com'", schemas=schemas, validate_schema=True)
-        assert "field not found in schema" in str(exc_info.value)
-        assert "email" in exc_info.value.internal_details
-
-    def test_unknown_table_raises(self):
+    def test_unknown_table_raises(self, schemas):
         """Unknown table raises InvalidSchemaError."""
-        schemas = _make_schemas()
         with pytest.raises(InvalidSchemaError) as exc_info:
             convert("orders.total > 100", schemas=schemas, validate_schema=True)
-        assert "field not found in schema" in str(exc_info.value)
-        assert "orders" in exc_info.value.internal_details
+        err = exc_info.value
+        assert "field not found in schema" in str(err)
+        assert "orders" in err.internal_details
 
-    def test_multiple_valid_fields(self):
+    def test_error_dual_messaging(self, schemas):
+        """Error uses sanitized user message and detailed internal message."""
+        with pytest.raises(InvalidSchemaError) as exc_info:
+            convert("usr.missing == 1", schemas=schemas, validate_schema=True)
+        err = exc_info.value
+        # User-facing message is sanitized
+        assert str(err) == "field not found in schema"
+        # Internal detail has specifics
+        details = err.internal_details
+        assert "missing" in details
+        assert "usr" in details
+
+    def test_multiple_valid_fields(self, schemas):
         """Multiple known fields pass validation."""
-        schemas = _make_schemas()
         result = convert(
             "usr.name == 'alice' && usr.age > 18",
             schemas=schemas,
             validate_schema=True,
         )
-        assert "usr.name" in result
-        assert "usr.age" in result
-
-    def test_error_dual_messaging(self):
-        """Error uses sanitized user message and detailed internal message."""
-        schemas = _make_schemas()
-        with pytest.raises(InvalidSchemaError) as exc_info:
-            convert("usr.missing == 1", schemas=schemas, validate_schema=True)
-        # User-facing message is sanitized
-        assert str(exc_info.value) == "field not found in schema"
-        # Internal detail has specifics
-        assert "missing" in exc_info.value.internal_details
-        assert "usr" in exc_info.value.internal_details
+        assert_has_all(result, ["usr.name", "usr.age"])
 
 
 class TestValidateSchemaJSON:
     """Tests for JSON field validation."""
 
-    def test_json_first_field_validated(self):
+    def test_json_unknown_first_field_raises(self, schemas):
+        """Unknown first field with JSON-like access raises."""
+        with pytest.raises(InvalidSchemaError):
+            convert("usr.config.key == 'val'", schemas=schemas, validate_schema=True)
+
+    def test_json_first_field_validated(self, schemas):
         """JSON field validates that the first field exists in schema."""
-        schemas = _make_schemas()
         result = convert(
             "usr.metadata.key == 'val'",
             schemas=schemas,
@@ -104,9 +106,8 @@ class TestValidateSchemaJSON:
         )
         assert result  # Should succeed since 'metadata' is in schema
 
-    def test_json_nested_keys_not_over_validated(self):
+    def test_json_nested_keys_not_over_validated(self, schemas):
         """Nested JSON keys beyond first field are not validated."""
-        schemas = _make_schemas()
         # 'metadata' exists but 'settings' and 'theme' are nested JSON keys — should pass
         result = convert(
             "usr.metadata.settings.theme == 'dark'",
@@ -115,19 +116,12 @@ class TestValidateSchemaJSON:
         )
         assert result
 
-    def test_json_unknown_first_field_raises(self):
-        """Unknown first field with JSON-like access raises."""
-        schemas = _make_schemas()
-        with pytest.raises(InvalidSchemaError):
-            convert("usr.config.key == 'val'", schemas=schemas, validate_schema=True)
-
 
 class TestValidateSchemaComprehensions:
     """Tests for comprehension variable handling."""
 
-    def test_comprehension_var_not_validated(self):
+    def test_comprehension_var_not_validated(self, schemas):
         """Comprehension variables are not validated against schema."""
-        schemas = _make_schemas()
         result = convert(
             "usr.tags.all(t, t == 'admin')",
             schemas=schemas,
@@ -135,9 +129,8 @@ class TestValidateSchemaComprehensions:
         )
         assert result
 
-    def test_comprehension_with_field_access(self):
+    def test_comprehension_with_field_access(self, schemas):
         """Comprehension on a valid field succeeds."""
-        schemas = _make_schemas()
         result = convert(
             "usr.tags.exists(t, t == 'admin')",
             schemas=schemas,
@@ -149,9 +142,8 @@ class TestValidateSchemaComprehensions:
 class TestValidateSchemaBareIdents:
     """Tests for bare identifiers (no table prefix)."""
 
-    def test_bare_ident_not_validated(self):
+    def test_bare_ident_not_validated(self, schemas):
         """Bare identifiers without table prefix are not validated."""
-        schemas = _make_schemas()
         result = convert(
             "age > 10",
             schemas=schemas,
@@ -160,46 +152,24 @@ class TestValidateSchemaBareIdents:
         assert "age" in result
 
 
-class TestValidateSchemaConvertParameterized:
-    """Tests for validate_schema with convert_parameterized."""
+class TestValidateSchemaEntryPoints:
+    """validate_schema behaves the same through every public entry point."""
 
-    def test_valid_field_succeeds(self):
-        schemas = _make_schemas()
-        result = convert_parameterized(
-            "usr.name == 'alice'",
-            schemas=schemas,
-            validate_schema=True,
-        )
-        assert result.sql
-        assert result.parameters
-
-    def test_unknown_field_raises(self):
-        schemas = _make_schemas()
-        with pytest.raises(InvalidSchemaError):
-            convert_parameterized(
-                "usr.email == 'test'",
-                schemas=schemas,
-                validate_schema=True,
-            )
-
-
-class TestValidateSchemaAnalyze:
-    """Tests for validate_schema with analyze."""
+    @pytest.mark.parametrize("fn", _ENTRY_POINTS)
+    def test_unknown_field_raises(self, schemas, fn):
+        """Unknown field raises InvalidSchemaError."""
+        with pytest.raises(InvalidSchemaError) as exc_info:
+            fn("usr.email == 'test@example.com'", schemas=schemas, validate_schema=True)
+        err = exc_info.value
+        assert "field not found in schema" in str(err)
+        assert "email" in err.internal_details
 
-    def test_valid_field_succeeds(self):
-        schemas = _make_schemas()
-        result = analyze(
-            "usr.name == 'alice'",
-            schemas=schemas,
-            validate_schema=True,
-        )
-        assert result.sql
+    @pytest.mark.parametrize("fn", _ENTRY_POINTS)
+    def test_valid_field_succeeds(self, schemas, fn):
+        """Known field passes validation."""
+        result = fn("usr.name == 'alice'", schemas=schemas, validate_schema=True)
+        assert "usr.name" in _sql(result)
 
-    def test_unknown_field_raises(self):
-        schemas = _make_schemas()
-        with pytest.raises(InvalidSchemaError):
-            analyze(
-                "usr.email == 'test'",
-                schemas=schemas,
-                validate_schema=True,
-            )
+    def test_parameterized_keeps_parameters(self, schemas):
+        result = convert_parameterized("usr.name == 'alice'", schemas=schemas, validate_schema=True)
+        assert result.parameters == ["alice"]